@@ -12,6 +12,7 @@ Deploy: Push to GitHub and connect to Streamlit Cloud
 import streamlit as st
 import importlib.util
 import os
+import traceback
 
 
 # Page configuration
@@ -22,41 +23,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .stApp {
-        max-width: 1400px;
-        margin: 0 auto;
-    }
-    .tool-card {
-        padding: 2em;
-        border-radius: 10px;
-        border: 2px solid #e0e0e0;
-        margin: 1em 0;
-        transition: all 0.3s ease;
-        background: linear-gradient(135deg, #f5f7fa 0%, #ffffff 100%);
-    }
-    .tool-card:hover {
-        border-color: #1f77b4;
-        box-shadow: 0 4px 12px rgba(31, 119, 180, 0.15);
-    }
-    .tool-title {
-        font-size: 1.5em;
-        font-weight: bold;
-        color: #1f77b4;
-        margin-bottom: 0.5em;
-    }
-    .tool-description {
-        color: #666;
-        line-height: 1.6;
-    }
-    .welcome-header {
-        text-align: center;
-        padding: 2em 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better styling (static file, so browsers cache it across reruns)
+st.markdown('<link rel="stylesheet" href="app/static/style.css">', unsafe_allow_html=True)
 
 
 def home_page():
@@ -192,7 +160,6 @@ def load_and_run_page(file_path):
     except Exception as e:
         # Handle all other errors
         st.error(f"Error loading page: {str(e)}")
-        import traceback
         with st.expander("Technical details"):
             st.code(traceback.format_exc())
     finally:
@@ -22,9 +22,11 @@ class Settings(BaseSettings):
     session_timeout_seconds: int = 600  # 10 minutes
     max_2fa_wait_seconds: int = 90  # 90 seconds for 2FA
     max_concurrent_sessions: int = 10
+    login_cache_ttl_seconds: int = 1800  # Reuse a successful login for 30 minutes
     
     # Upload settings
     max_upload_size_mb: int = 10
+    upload_concurrency: int = 4  # Images uploaded in parallel per session
     allowed_extensions: set = {"jpg", "jpeg", "png", "gif"}
     
     # Luminate URLs
@@ -4,15 +4,13 @@ Luminate Cookbook - FastAPI Application
 Main entry point for the FastAPI application.
 """
 
-import os
+import json
 import uuid
-import tempfile
-import shutil
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, UploadFile, File, Form, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import asyncio
@@ -35,6 +33,7 @@ from app.models.schemas import (
     EmailBeautifierResponse,
 )
 from app.services.browser_manager import browser_manager
+from app.services.image_optimizer import DEFAULT_MAX_DIMENSION
 
 
 # Lifespan context manager for startup/shutdown
@@ -122,12 +121,89 @@ async def email_beautifier_page(request: Request):
 # Upload API Routes
 # =============================================================================
 
+def _validate_uploads(files: List[UploadFile]) -> Optional[str]:
+    """
+    Check every upload's type and size before anything is buffered.
+    
+    Shared by the HTML and JSON start endpoints so both apply the same rules.
+    
+    Returns:
+        Error message for the first invalid file, or None if all are valid
+    """
+    allowed = settings.allowed_extensions
+    max_bytes = settings.max_upload_size_mb * 1024 * 1024
+    for file in files:
+        ext = file.filename.rpartition(".")[2].lower() if "." in file.filename else ""
+        if ext not in allowed:
+            return f"Invalid file type: {file.filename}. Allowed: {', '.join(allowed)}"
+        
+        # Starlette reports the size from the spool, so nothing is read yet
+        size = file.size or 0
+        if size > max_bytes:
+            return (
+                f"File too large: {file.filename} ({size / (1024 * 1024):.1f}MB). "
+                f"Max: {settings.max_upload_size_mb}MB"
+            )
+    return None
+
+
+async def _read_uploads(files: List[UploadFile]) -> List[Tuple[str, bytes]]:
+    """
+    Read validated uploads into memory concurrently.
+    
+    Files over Starlette's spool threshold live on disk and are read in the
+    threadpool, so gathering the reads overlaps them instead of reading one
+    file at a time. Each spooled temp file is closed once its bytes are in.
+    """
+    async def read_one(file: UploadFile) -> Tuple[str, bytes]:
+        content = await file.read()
+        await file.close()
+        return (file.filename, content)
+    
+    return list(await asyncio.gather(*(read_one(file) for file in files)))
+
+
+async def _render_session_status(request: Request, session_id: str, version: Optional[str] = None) -> Response:
+    """
+    Render a session's current status partial for HTMX.
+    
+    Shared by the start, 2FA and polling endpoints so they handle a missing
+    session the same way.
+    
+    Args:
+        request: Incoming request (needed by the template)
+        session_id: Upload session to render
+        version: status_version the client last rendered, if polling
+        
+    Returns:
+        The status partial, the error partial if the session is gone, or an
+        empty 204 if the status has not changed since version
+    """
+    status = await browser_manager.get_session_status(session_id)
+    
+    if status is None:
+        return templates.TemplateResponse("partials/upload_error.html", {
+            "request": request,
+            "error": "Session not found or expired",
+        })
+    
+    if version is not None and version == status["status_version"]:
+        return Response(status_code=204)
+    
+    return templates.TemplateResponse("partials/upload_status.html", {
+        "request": request,
+        **status,
+    })
+
+
 @app.post("/upload/start", response_class=HTMLResponse)
 async def upload_start_html(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
     files: List[UploadFile] = File(...),
+    resize: bool = Form(False),
+    max_dim: int = Form(DEFAULT_MAX_DIMENSION),
 ):
     """
     Start upload session and return HTML partial for HTMX.
@@ -140,56 +216,30 @@ async def upload_start_html(
             "error": "No files provided",
         })
     
-    # Validate file sizes and types
-    temp_dir = tempfile.mkdtemp()
-    saved_files = []
-    
+    # Validate file sizes and types; contents stay in memory for the session
     try:
-        for file in files:
-            # Check extension
-            ext = file.filename.split(".")[-1].lower() if "." in file.filename else ""
-            if ext not in settings.allowed_extensions:
-                return templates.TemplateResponse("partials/upload_error.html", {
-                    "request": request,
-                    "error": f"Invalid file type: {file.filename}. Allowed: {', '.join(settings.allowed_extensions)}",
-                })
-            
-            # Save to temp directory
-            file_path = os.path.join(temp_dir, file.filename)
-            content = await file.read()
-            
-            # Check size
-            size_mb = len(content) / (1024 * 1024)
-            if size_mb > settings.max_upload_size_mb:
-                return templates.TemplateResponse("partials/upload_error.html", {
-                    "request": request,
-                    "error": f"File too large: {file.filename} ({size_mb:.1f}MB). Max: {settings.max_upload_size_mb}MB",
-                })
-            
-            with open(file_path, "wb") as f:
-                f.write(content)
-            saved_files.append(file_path)
+        validation_error = _validate_uploads(files)
+        if validation_error:
+            return templates.TemplateResponse("partials/upload_error.html", {
+                "request": request,
+                "error": validation_error,
+            })
         
-        # Create browser session and start login
+        saved_files = await _read_uploads(files)
+        
+        # Create browser session; login runs in the background and the
+        # returned partial polls until it reaches 2FA, uploads or an error
         session_id, state, needs_2fa, message, error = await browser_manager.create_session(
             username=username,
             password=password,
             files=saved_files,
-            temp_dir=temp_dir,
+            resize_max_dim=max_dim if resize else None,
+            wait_for_login=False,
         )
         
-        # Get full status to render template
-        status = await browser_manager.get_session_status(session_id)
-        
-        # Return HTML partial
-        return templates.TemplateResponse("partials/upload_status.html", {
-            "request": request,
-            **status,
-        })
+        return await _render_session_status(request, session_id)
         
     except Exception as e:
-        # Clean up on unexpected error
-        shutil.rmtree(temp_dir, ignore_errors=True)
         return templates.TemplateResponse("partials/upload_error.html", {
             "request": request,
             "error": str(e),
@@ -201,6 +251,8 @@ async def upload_start(
     username: str = Form(...),
     password: str = Form(...),
     files: List[UploadFile] = File(...),
+    resize: bool = Form(False),
+    max_dim: int = Form(DEFAULT_MAX_DIMENSION),
 ):
     """
     Start an upload session.
@@ -212,42 +264,20 @@ async def upload_start(
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
     
-    # Validate file sizes and types
-    temp_dir = tempfile.mkdtemp()
-    saved_files = []
-    
+    # Validate file sizes and types; contents stay in memory for the session
     try:
-        for file in files:
-            # Check extension
-            ext = file.filename.split(".")[-1].lower() if "." in file.filename else ""
-            if ext not in settings.allowed_extensions:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid file type: {file.filename}. Allowed: {settings.allowed_extensions}"
-                )
-            
-            # Save to temp directory
-            file_path = os.path.join(temp_dir, file.filename)
-            content = await file.read()
-            
-            # Check size
-            size_mb = len(content) / (1024 * 1024)
-            if size_mb > settings.max_upload_size_mb:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File too large: {file.filename} ({size_mb:.1f}MB). Max: {settings.max_upload_size_mb}MB"
-                )
-            
-            with open(file_path, "wb") as f:
-                f.write(content)
-            saved_files.append(file_path)
+        validation_error = _validate_uploads(files)
+        if validation_error:
+            raise HTTPException(status_code=400, detail=validation_error)
+        
+        saved_files = await _read_uploads(files)
         
         # Create browser session and start login
         session_id, state, needs_2fa, message, error = await browser_manager.create_session(
             username=username,
             password=password,
             files=saved_files,
-            temp_dir=temp_dir,
+            resize_max_dim=max_dim if resize else None,
         )
         
         return UploadStartResponse(
@@ -259,12 +289,8 @@ async def upload_start(
         )
         
     except HTTPException:
-        # Clean up on validation error
-        shutil.rmtree(temp_dir, ignore_errors=True)
         raise
     except Exception as e:
-        # Clean up on unexpected error
-        shutil.rmtree(temp_dir, ignore_errors=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -282,20 +308,7 @@ async def upload_2fa_html(
         code=code,
     )
     
-    # Get full status to render template
-    status = await browser_manager.get_session_status(session_id)
-    
-    if status is None:
-        return templates.TemplateResponse("partials/upload_error.html", {
-            "request": request,
-            "error": "Session not found or expired",
-        })
-    
-    # Return HTML partial with updated status
-    return templates.TemplateResponse("partials/upload_status.html", {
-        "request": request,
-        **status,
-    })
+    return await _render_session_status(request, session_id)
 
 
 @app.post("/api/upload/2fa/{session_id}", response_model=TwoFactorResponse)
@@ -347,24 +360,25 @@ async def upload_cancel(session_id: str):
     return {"success": True, "message": "Session cancelled"}
 
 
+@app.post("/api/upload/logout")
+async def upload_logout(username: str = Form(...)):
+    """
+    Forget a cached Luminate login so the next upload signs in again.
+    """
+    forgotten = browser_manager.forget_login(username)
+    return {"success": True, "message": "Signed out" if forgotten else "No saved login"}
+
+
 # HTMX partial responses for upload status
 @app.get("/api/upload/status/{session_id}/partial", response_class=HTMLResponse)
-async def upload_status_partial(request: Request, session_id: str):
+async def upload_status_partial(request: Request, session_id: str, v: Optional[str] = None):
     """
     Return HTML partial for upload status (used by HTMX polling).
-    """
-    status = await browser_manager.get_session_status(session_id)
-    
-    if status is None:
-        return templates.TemplateResponse("partials/upload_error.html", {
-            "request": request,
-            "error": "Session not found or expired",
-        })
     
-    return templates.TemplateResponse("partials/upload_status.html", {
-        "request": request,
-        **status,
-    })
+    Polls send the status_version they were rendered from; if nothing has
+    changed since, reply 204 so HTMX keeps the current DOM (no swap).
+    """
+    return await _render_session_status(request, session_id, v)
 
 
 # =============================================================================
@@ -432,7 +446,6 @@ async def banner_process(
                      e.g., '{"image.jpg": {"x1": 0, "y1": 100, "x2": 600, "y2": 440}}'
     """
     from app.services.banner_processor import process_banners
-    import json
     
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
@@ -1,15 +1,27 @@
 """
 Services module - Business logic for Luminate Cookbook.
+
+Exports are resolved lazily so importing one service (e.g. the browser
+manager at app startup) doesn't pull in OpenCV/MediaPipe for banners.
 """
 
-from .browser_manager import BrowserSessionManager, browser_manager
-from .banner_processor import process_banners
-from .pagebuilder_service import analyze_pagebuilder, decompose_pagebuilder
-
-__all__ = [
-    "BrowserSessionManager",
-    "browser_manager",
-    "process_banners",
-    "analyze_pagebuilder",
-    "decompose_pagebuilder",
-]
+import importlib
+
+_EXPORTS = {
+    "BrowserSessionManager": ".browser_manager",
+    "browser_manager": ".browser_manager",
+    "process_banners": ".banner_processor",
+    "analyze_pagebuilder": ".pagebuilder_service",
+    "decompose_pagebuilder": ".pagebuilder_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,7 +5,13 @@ Processes images into email banners with intelligent person detection.
 Uses MediaPipe for full-body detection and OpenCV for face detection fallback.
 """
 
+import asyncio
+import base64
 import io
+import os
+import tempfile
+import time
+import urllib.request
 import zipfile
 from typing import List, Tuple, Any, Optional, Dict
 from PIL import Image
@@ -21,6 +27,10 @@ from app.models.schemas import BannerSettings, BannerResult
 # Cache the detectors
 _face_cascade = None
 _pose_detector = None
+# After a failed download/init, wait this long before trying again instead
+# of retrying for every image
+POSE_DETECTOR_RETRY_SECONDS = 300
+_pose_detector_failed_at = None
 
 
 def get_face_detector():
@@ -34,14 +44,13 @@ def get_face_detector():
 
 def get_pose_detector():
     """Get or create the MediaPipe pose detector (cached)."""
-    global _pose_detector
-    if _pose_detector is None:
+    global _pose_detector, _pose_detector_failed_at
+    if _pose_detector is None and (
+        _pose_detector_failed_at is None
+        or time.monotonic() - _pose_detector_failed_at >= POSE_DETECTOR_RETRY_SECONDS
+    ):
         try:
             # Download and cache the model file in project directory or temp
-            import os
-            import urllib.request
-            import tempfile
-            
             # Try project directory first, fall back to temp
             try:
                 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -58,7 +67,18 @@ def get_pose_detector():
             if not os.path.exists(model_path):
                 print("Downloading MediaPipe pose detection model...")
                 model_url = 'https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_lite/float16/latest/pose_landmarker_lite.task'
-                urllib.request.urlretrieve(model_url, model_path)
+                # Download beside the target and rename, so an interrupted
+                # download never leaves a truncated model that is reused forever
+                tmp_path = f"{model_path}.{os.getpid()}.tmp"
+                try:
+                    urllib.request.urlretrieve(model_url, tmp_path)
+                    os.replace(tmp_path, model_path)
+                except Exception:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                    raise
                 print(f"Model downloaded successfully to {model_path}")
             
             # Initialize detector with local model
@@ -72,10 +92,12 @@ def get_pose_detector():
                 min_tracking_confidence=0.5
             )
             _pose_detector = vision.PoseLandmarker.create_from_options(options)
+            _pose_detector_failed_at = None
         except Exception as e:
             print(f"Warning: Could not initialize MediaPipe pose detector: {e}")
             print("Falling back to face detection only")
             _pose_detector = None
+            _pose_detector_failed_at = time.monotonic()
     return _pose_detector
 
 
@@ -354,13 +376,14 @@ def process_single_image(
     if icc_profile:
         save_kwargs['icc_profile'] = icc_profile
     resized.save(buffer, **save_kwargs)
-    buffer.seek(0)
+    # One copy out of the buffer, reused for the size
+    banner_bytes = buffer.getvalue()
     
     results.append({
-        'bytes': buffer.getvalue(),
+        'bytes': banner_bytes,
         'width': settings.width,
         'height': settings.height,
-        'size_kb': len(buffer.getvalue()) / 1024,
+        'size_kb': len(banner_bytes) / 1024,
         'suffix': f"_{settings.width}"
     })
     
@@ -385,13 +408,13 @@ def process_single_image(
         if icc_profile:
             retina_save_kwargs['icc_profile'] = icc_profile
         resized_retina.save(buffer_retina, **retina_save_kwargs)
-        buffer_retina.seek(0)
+        retina_bytes = buffer_retina.getvalue()
         
         results.append({
-            'bytes': buffer_retina.getvalue(),
+            'bytes': retina_bytes,
             'width': retina_width,
             'height': retina_height,
-            'size_kb': len(buffer_retina.getvalue()) / 1024,
+            'size_kb': len(retina_bytes) / 1024,
             'suffix': f"_{retina_width}"
         })
     
@@ -412,8 +435,6 @@ def generate_crop_preview(
     Returns:
         Dict with image_base64, crop_box, people_detected, faces_detected, dimensions
     """
-    import base64
-    
     # Load image
     pil_image = Image.open(io.BytesIO(image_bytes))
     
@@ -490,8 +511,6 @@ async def process_banners(
     Returns:
         Tuple of (zip_bytes, list of BannerResult)
     """
-    import asyncio
-    
     all_results = []
     processed_data = []
     
@@ -545,5 +564,4 @@ async def process_banners(
                 
                 zip_file.writestr(filename, result['bytes'])
     
-    zip_buffer.seek(0)
     return zip_buffer.getvalue(), all_results
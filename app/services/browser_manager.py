@@ -7,17 +7,67 @@ browser sessions alive as persistent server-side objects.
 """
 
 import asyncio
+import os
 import uuid
 import time
-import shutil
 import random
 import re
+import mimetypes
+import hashlib
+import zlib
 from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 
+import httpx
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
 from app.config import settings
 from app.models.schemas import SessionState, UploadResult
+from app.services.image_optimizer import shrink_image
+from lib.luminate_uploader_lib import (
+    CONTEXT_OPTIONS,
+    FORM_ACTION_JS,
+    STEALTH_SCRIPT,
+    TWO_FACTOR_TEXT_RE,
+    close_upload_dialog_async,
+    upload_response_predicate,
+)
+
+
+# Attempts per file; transient failures back off 2**attempt seconds (plus jitter)
+UPLOAD_ATTEMPTS = 3
+VERIFY_FAILED_ERROR = "Upload completed but verification failed"
+
+# Sessions kept only so their results can be polled; they don't count toward the cap
+_FINISHED_STATES = (SessionState.DONE, SessionState.ERROR, SessionState.CANCELLED)
+
+# Remembered (username, filename, sha256) -> URL entries; oldest dropped first
+UPLOAD_CACHE_MAX_ENTRIES = 5000
+
+# Login failure messages, matched with one regex pass over the lowercased HTML
+_LOGIN_ERROR_RE = re.compile('|'.join(map(re.escape, (
+    'invalid username or password',
+    'incorrect username or password',
+    'login failed',
+    'authentication failed',
+    'invalid credentials',
+))))
+
+
+def _sha256_hex(content: bytes) -> str:
+    """Hex SHA-256 of an uploaded file's bytes."""
+    return hashlib.sha256(content).hexdigest()
+
+
+# Pillow releases the GIL while encoding, so resizes run in parallel threads
+_RESIZE_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="resize")
 
 
 @dataclass
@@ -27,8 +77,10 @@ class BrowserSession:
     username: str
     state: SessionState
     created_at: float
-    files_to_upload: List[str]
-    temp_dir: str
+    files_to_upload: List[str]  # Filenames, parallel to file_contents
+    file_contents: List[bytes]  # Uploaded bytes, kept in memory (no temp files)
+    resize_jobs: List[Optional[asyncio.Future]] = field(default_factory=list)  # Downscaled bytes, parallel to file_contents; None once consumed
+    content_hashes: List[str] = field(default_factory=list)  # SHA-256 of the original bytes
     
     # Playwright objects (set after creation)
     playwright: Any = None
@@ -36,6 +88,10 @@ class BrowserSession:
     context: Any = None
     page: Any = None
     
+    # Cookies from a cached login (skips the login browser when set)
+    storage_state: Optional[Dict[str, Any]] = None
+    password_hash: str = ""
+    
     # Progress tracking
     current_file_index: int = 0
     results: List[UploadResult] = field(default_factory=list)
@@ -79,21 +135,57 @@ class BrowserSessionManager:
     def __init__(self):
         self._sessions: Dict[str, BrowserSession] = {}
         self._lock = asyncio.Lock()
+        # username -> (password_hash, storage_state, saved_at) for reusing logins
+        self._login_cache: Dict[str, Tuple[str, Dict[str, Any], float]] = {}
+        # (username, filename, sha256) -> URL of files already uploaded
+        self._upload_cache: Dict[Tuple[str, str, str], str] = {}
+        # Async Chromium shared by all upload phases (launched on first use)
+        self._upload_playwright: Any = None
+        self._upload_browser: Any = None
+        self._upload_browser_lock = asyncio.Lock()
+        # Shared client for upload verification (created on first use)
+        self._http_client: Optional[httpx.AsyncClient] = None
     
     @property
     def active_session_count(self) -> int:
-        return len(self._sessions)
+        """Sessions still logging in or uploading (finished ones only hold results)."""
+        return sum(1 for session in self._sessions.values() if session.state not in _FINISHED_STATES)
+    
+    def _cached_login(self, username: str, password_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached storage state for these credentials, if still fresh."""
+        entry = self._login_cache.get(username)
+        if entry is None:
+            return None
+        cached_hash, storage_state, saved_at = entry
+        if time.time() - saved_at > settings.login_cache_ttl_seconds:
+            self._login_cache.pop(username, None)
+            return None
+        return storage_state if cached_hash == password_hash else None
+    
+    def forget_login(self, username: str) -> bool:
+        """Drop a cached login so the next upload signs in again."""
+        return self._login_cache.pop(username, None) is not None
     
     async def create_session(
         self,
         username: str,
         password: str,
-        files: List[str],
-        temp_dir: str,
+        files: List[Tuple[str, bytes]],
+        resize_max_dim: Optional[int] = None,
+        wait_for_login: bool = True,
     ) -> Tuple[str, SessionState, bool, str, Optional[str]]:
         """
         Create a new browser session and attempt login.
         
+        Args:
+            username: Luminate username
+            password: Luminate password
+            files: (filename, content) pairs to upload once authenticated
+            resize_max_dim: Downscale images larger than this before upload
+                (done in a thread pool while login and earlier uploads run)
+            wait_for_login: If False, return as soon as the session exists and
+                log in in the background (state moves on from INITIALIZING)
+        
         Returns:
             Tuple of (session_id, state, needs_2fa, message, error)
         """
@@ -105,14 +197,15 @@ class BrowserSessionManager:
             username=username,
             state=SessionState.INITIALIZING,
             created_at=time.time(),
-            files_to_upload=files,
-            temp_dir=temp_dir,
+            files_to_upload=[name for name, _ in files],
+            file_contents=[content for _, content in files],
+            password_hash=hashlib.sha256(password.encode()).hexdigest(),
             message="Initializing browser session...",
         )
         
         async with self._lock:
-            # Check max sessions
-            if len(self._sessions) >= settings.max_concurrent_sessions:
+            # Check max sessions before hashing or resizing anything
+            if self.active_session_count >= settings.max_concurrent_sessions:
                 return (
                     session_id,
                     SessionState.ERROR,
@@ -122,6 +215,55 @@ class BrowserSessionManager:
                 )
             self._sessions[session_id] = session
         
+        loop = asyncio.get_event_loop()
+        # hashlib releases the GIL on large buffers, so hash off the event loop
+        session.content_hashes = await loop.run_in_executor(
+            None, lambda: [_sha256_hex(content) for content in session.file_contents]
+        )
+        # A file picked twice (same name, same bytes) maps to the same URL; upload it once
+        first_index = {}
+        for index, key in enumerate(zip(session.files_to_upload, session.content_hashes)):
+            first_index.setdefault(key, index)
+        if len(first_index) < len(session.files_to_upload):
+            keep = sorted(first_index.values())
+            session.files_to_upload = [session.files_to_upload[i] for i in keep]
+            session.file_contents = [session.file_contents[i] for i in keep]
+            session.content_hashes = [session.content_hashes[i] for i in keep]
+        if resize_max_dim:
+            session.resize_jobs = [
+                loop.run_in_executor(_RESIZE_POOL, shrink_image, content, resize_max_dim)
+                for content in session.file_contents
+            ]
+        
+        # A recent login for the same credentials skips login (and 2FA) entirely
+        session.storage_state = self._cached_login(username, session.password_hash)
+        if session.storage_state is not None:
+            session.state = SessionState.AUTHENTICATED
+            session.message = "Using your recent login. Starting uploads..."
+            asyncio.create_task(self._perform_uploads(session))
+            return (session_id, session.state, False, session.message, None)
+        
+        if not wait_for_login:
+            # Browser launch and login take seconds; let the status partial
+            # poll for the outcome (2FA prompt, uploads or error) instead
+            session.message = "Starting browser..."
+            asyncio.create_task(self._login_and_start(session, username, password))
+            return (session_id, session.state, False, session.message, None)
+        
+        return await self._login_and_start(session, username, password)
+    
+    async def _login_and_start(
+        self,
+        session: BrowserSession,
+        username: str,
+        password: str,
+    ) -> Tuple[str, SessionState, bool, str, Optional[str]]:
+        """
+        Launch the login browser, log in and start uploads if no 2FA is needed.
+        
+        Returns:
+            Tuple of (session_id, state, needs_2fa, message, error)
+        """
         # Initialize browser in a thread pool (Playwright is sync)
         try:
             await self._initialize_browser(session)
@@ -134,12 +276,12 @@ class BrowserSessionManager:
             if error:
                 session.state = SessionState.ERROR
                 session.error = error
-                return (session_id, session.state, False, "", error)
+                return (session.id, session.state, False, "", error)
             
             if needs_2fa:
                 session.state = SessionState.AWAITING_2FA
                 session.message = "Two-factor authentication required. Please enter your 6-digit code."
-                return (session_id, session.state, True, session.message, None)
+                return (session.id, session.state, True, session.message, None)
             
             # Login successful, start uploads
             session.state = SessionState.AUTHENTICATED
@@ -148,13 +290,13 @@ class BrowserSessionManager:
             # Start upload process in background
             asyncio.create_task(self._perform_uploads(session))
             
-            return (session_id, session.state, False, session.message, None)
+            return (session.id, session.state, False, session.message, None)
             
         except Exception as e:
             session.state = SessionState.ERROR
             session.error = str(e)
             await self._cleanup_session(session)
-            return (session_id, session.state, False, "", str(e))
+            return (session.id, session.state, False, "", str(e))
     
     async def submit_2fa(
         self,
@@ -216,9 +358,16 @@ class BrowserSessionManager:
             "total_files": len(session.files_to_upload),
             "completed_files": session.current_file_index,
             "results": session.results,
+            # Derived once here rather than by repeated filters in the template
+            "successful_urls": [r.url for r in session.results if r.success],
             "message": session.message,
             "error": session.error,
             "time_remaining_seconds": session.time_remaining_seconds,
+            # Changes whenever anything the polling partials show changes
+            "status_version": (
+                f"{session.state.value}-{session.current_file_index}-"
+                f"{len(session.results)}-{zlib.crc32(session.message.encode()):x}"
+            ),
         }
     
     async def cancel_session(self, session_id: str) -> bool:
@@ -250,9 +399,26 @@ class BrowserSessionManager:
     async def shutdown(self):
         """Shutdown all sessions on app shutdown."""
         async with self._lock:
-            for session in list(self._sessions.values()):
-                await self._cleanup_session(session)
+            sessions = list(self._sessions.values())
             self._sessions.clear()
+        await asyncio.gather(*(self._cleanup_session(session) for session in sessions))
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        await self.recycle_upload_browser()
+    
+    async def recycle_upload_browser(self):
+        """Close the shared upload browser; the next upload launches a fresh one."""
+        async with self._upload_browser_lock:
+            browser, self._upload_browser = self._upload_browser, None
+            playwright, self._upload_playwright = self._upload_playwright, None
+        try:
+            if browser is not None:
+                await browser.close()
+            if playwright is not None:
+                await playwright.stop()
+        except:
+            pass
     
     # =========================================================================
     # Private Methods - Playwright Operations
@@ -273,28 +439,12 @@ class BrowserSessionManager:
         )
         
         # Create context with realistic browser fingerprint
-        session.context = session.browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/New_York',
-            color_scheme='light',
-            extra_http_headers={
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            }
-        )
+        session.context = session.browser.new_context(**CONTEXT_OPTIONS)
         
         session.page = session.context.new_page()
         
         # Inject anti-detection script
-        session.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-            Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-            window.chrome = { runtime: {} };
-        """)
+        session.page.add_init_script(STEALTH_SCRIPT)
     
     async def _perform_login(
         self,
@@ -363,19 +513,7 @@ class BrowserSessionManager:
             current_url = page.url
             page_content = page.content().lower()
             
-            # 2FA indicators
-            two_factor_indicators = [
-                'we sent a security code',
-                'security code:',
-                'two-factor',
-                '2fa',
-                'verification code',
-                'authenticator',
-                'enter code',
-                'verify your identity'
-            ]
-            
-            has_2fa_prompt = any(indicator in page_content for indicator in two_factor_indicators)
+            has_2fa_prompt = TWO_FACTOR_TEXT_RE.search(page_content) is not None
             
             # Check for 2FA input field
             has_2fa_input = False
@@ -401,14 +539,7 @@ class BrowserSessionManager:
                     pass
             
             # Check for login errors
-            error_indicators = [
-                'invalid username or password',
-                'incorrect username or password',
-                'login failed',
-                'authentication failed',
-                'invalid credentials'
-            ]
-            has_error = any(error_term in page_content for error_term in error_indicators)
+            has_error = _LOGIN_ERROR_RE.search(page_content) is not None
             
             if has_error:
                 return (False, "Login failed. Please check your credentials.")
@@ -428,7 +559,7 @@ class BrowserSessionManager:
             # Re-check for 2FA after navigation attempt
             current_url = page.url
             page_content = page.content().lower()
-            has_2fa_prompt = any(indicator in page_content for indicator in two_factor_indicators)
+            has_2fa_prompt = TWO_FACTOR_TEXT_RE.search(page_content) is not None
             
             if has_2fa_prompt or 'AdminLogin' in current_url:
                 return (True, None)
@@ -556,11 +687,7 @@ class BrowserSessionManager:
             
             # Check if 2FA prompt is still there
             page_content = page.content().lower()
-            two_factor_indicators = [
-                'two-factor', '2fa', 'verification code', 'authenticator',
-                'security code', 'enter code', 'verify your identity', 'additional-auth'
-            ]
-            still_has_2fa = any(indicator in page_content for indicator in two_factor_indicators)
+            still_has_2fa = TWO_FACTOR_TEXT_RE.search(page_content) is not None
             
             if still_has_2fa:
                 return (False, "Invalid 2FA code. Please try again.")
@@ -578,34 +705,102 @@ class BrowserSessionManager:
             return (False, f"Error submitting 2FA code: {str(e)}")
     
     async def _perform_uploads(self, session: BrowserSession):
-        """Upload all files for a session."""
+        """
+        Upload all files for a session, several at a time.
+        
+        The login browser's cookies (or a cached login's) are handed to an
+        async Playwright context on the server's event loop, where up to
+        settings.upload_concurrency pages upload in parallel (asyncio.gather
+        bounded by a semaphore). Fresh logins are cached for reuse.
+        """
         session.state = SessionState.UPLOADING
         session.message = "Starting uploads..."
         
         loop = asyncio.get_event_loop()
+        total = len(session.files_to_upload)
         
         try:
-            for i, file_path in enumerate(session.files_to_upload):
-                session.current_file_index = i
-                filename = file_path.split("/")[-1]
-                session.message = f"Uploading {filename}... ({i+1}/{len(session.files_to_upload)})"
+            from_cache = session.storage_state is not None
+            if from_cache:
+                storage_state = session.storage_state
+            else:
+                # Reuse the authenticated session; the login browser is no longer needed
+                storage_state = await loop.run_in_executor(None, session.context.storage_state)
+                await self._cleanup_browser(session)
+                self._login_cache[session.username] = (session.password_hash, storage_state, time.time())
+            
+            # Warm shared browser; each session only gets its own context
+            browser = await self._get_upload_browser()
+            context = await browser.new_context(storage_state=storage_state, **CONTEXT_OPTIONS)
+            try:
+                await context.add_init_script(STEALTH_SCRIPT)
                 
-                # Upload single file
-                success, url, error = await loop.run_in_executor(
-                    None,
-                    self._sync_upload_file,
-                    session,
-                    file_path,
-                )
+                page_count = max(1, min(settings.upload_concurrency, total))
+                pages: asyncio.Queue = asyncio.Queue()
+                for _ in range(page_count):
+                    pages.put_nowait(await context.new_page())
+                
+                if from_cache:
+                    # Make sure the cached cookies are still signed in
+                    page = await pages.get()
+                    await page.goto(settings.luminate_image_library_url)
+                    pages.put_nowait(page)
+                    if 'AdminLogin' in page.url:
+                        self.forget_login(session.username)
+                        raise RuntimeError("Your saved login has expired. Please start the upload again to sign in.")
+                semaphore = asyncio.Semaphore(page_count)
+                
+                results: List[Optional[UploadResult]] = [None] * total
+                
+                async def upload_one(index: int, filename: str):
+                    # Identical bytes already uploaded under this name: reuse the URL
+                    cache_key = (session.username, filename, session.content_hashes[index])
+                    url = self._upload_cache.get(cache_key)
+                    if url is not None and await self._check_image_url(url, True):
+                        success, error = True, None
+                        session.file_contents[index] = b""
+                        if session.resize_jobs:
+                            # Not uploading it, so don't keep (or finish) the resize
+                            session.resize_jobs[index].cancel()
+                            session.resize_jobs[index] = None
+                    else:
+                        if session.resize_jobs:
+                            # Take the bytes out of the future so they can be freed after upload
+                            session.file_contents[index] = await session.resize_jobs[index]
+                            session.resize_jobs[index] = None
+                        async with semaphore:
+                            page = await pages.get()
+                            try:
+                                success, url, error = await self._async_upload_with_retry(
+                                    session, page, filename, session.file_contents[index]
+                                )
+                            finally:
+                                pages.put_nowait(page)
+                                # Release the bytes as soon as the browser has them
+                                session.file_contents[index] = b""
+                        if success:
+                            self._remember_upload(cache_key, url)
+                    
+                    results[index] = UploadResult(
+                        filename=filename,
+                        success=success,
+                        url=url,
+                        error=error,
+                    )
+                    # Show results as they land; final order is restored below
+                    session.results.append(results[index])
+                    session.current_file_index += 1
+                    session.message = f"Uploaded {filename} ({session.current_file_index}/{total})"
                 
-                session.results.append(UploadResult(
-                    filename=filename,
-                    success=success,
-                    url=url,
-                    error=error,
+                await asyncio.gather(*(
+                    upload_one(i, filename)
+                    for i, filename in enumerate(session.files_to_upload)
                 ))
+                session.results = [r for r in results if r is not None]
+            finally:
+                await context.close()
             
-            session.current_file_index = len(session.files_to_upload)
+            session.current_file_index = total
             session.state = SessionState.DONE
             
             successful = sum(1 for r in session.results if r.success)
@@ -619,77 +814,148 @@ class BrowserSessionManager:
             # Cleanup browser but keep session for results
             await self._cleanup_browser(session)
     
-    def _sync_upload_file(
+    async def _get_upload_browser(self) -> Any:
+        """Return the shared async upload browser, launching it if needed.
+        
+        Keeping one warm Chromium avoids a 1-3 s browser launch per upload
+        session; sessions stay isolated in their own contexts.
+        """
+        async with self._upload_browser_lock:
+            if self._upload_browser is None or not self._upload_browser.is_connected():
+                from playwright.async_api import async_playwright
+                
+                if self._upload_playwright is None:
+                    self._upload_playwright = await async_playwright().start()
+                self._upload_browser = await self._upload_playwright.chromium.launch(
+                    headless=settings.playwright_headless
+                )
+            return self._upload_browser
+    
+    def _remember_upload(self, cache_key: Tuple[str, str, str], url: str):
+        """Record an uploaded file's URL, evicting the oldest entries past the cap."""
+        self._upload_cache.pop(cache_key, None)
+        self._upload_cache[cache_key] = url
+        while len(self._upload_cache) > UPLOAD_CACHE_MAX_ENTRIES:
+            del self._upload_cache[next(iter(self._upload_cache))]
+    
+    async def _async_upload_with_retry(
         self,
         session: BrowserSession,
-        file_path: str,
+        page: Any,
+        filename: str,
+        content: bytes,
     ) -> Tuple[bool, Optional[str], Optional[str]]:
-        """Upload a single file (runs in thread pool)."""
-        page = session.page
-        filename = file_path.split("/")[-1]
+        """
+        Upload a file, retrying transient failures with exponential backoff.
+        
+        A file that was submitted but failed verification is not retried (a
+        second submit could duplicate it). If a failed attempt got as far as
+        clicking Upload, the expected URL is checked before retrying, so a
+        file that landed despite the error counts as done. Attempts that
+        failed earlier retry without the check, since an older image under
+        the same name would otherwise pass for this one.
+        """
+        url = settings.luminate_image_base_url + filename
+        for attempt in range(UPLOAD_ATTEMPTS):
+            success, uploaded_url, error, submitted = await self._async_upload_file(page, filename, content)
+            if success or error == VERIFY_FAILED_ERROR or attempt == UPLOAD_ATTEMPTS - 1:
+                return (success, uploaded_url, error)
+            
+            session.message = f"Retrying {filename} ({attempt + 2}/{UPLOAD_ATTEMPTS})..."
+            await asyncio.sleep(2 ** attempt + random.random())
+            if submitted and await self._check_image_url(url, True):
+                return (True, url, None)
+            try:
+                # Start the next attempt from a fresh Image Library load
+                await page.goto("about:blank")
+            except:
+                pass
+        return (success, uploaded_url, error)
+    
+    async def _async_upload_file(
+        self,
+        page: Any,
+        filename: str,
+        content: bytes,
+    ) -> Tuple[bool, Optional[str], Optional[str], bool]:
+        """
+        Upload a single file on an async Playwright page, straight from memory.
         
+        Returns:
+            Tuple of (success, url, error, submitted); submitted is True once
+            the Upload button was clicked, so the file may have landed
+        """
+        submitted = False
         try:
             # Navigate to Image Library if needed
-            current_url = page.url
-            if settings.luminate_image_library_url not in current_url:
-                page.goto(settings.luminate_image_library_url)
-                page.wait_for_load_state("networkidle")
-                page.wait_for_selector('text=Upload Image', timeout=10000)
+            if settings.luminate_image_library_url not in page.url:
+                await page.goto(settings.luminate_image_library_url, wait_until="domcontentloaded")
+                await page.get_by_role("link", name="Upload Image").wait_for(state="visible", timeout=10000)
             
             # Click Upload Image button
-            page.get_by_role("link", name="Upload Image").click()
-            page.wait_for_timeout(1500)
+            await page.get_by_role("link", name="Upload Image").click()
             
             # Find iframe and file input
             iframe_locator = page.frame_locator("iframe").last
             file_input = iframe_locator.locator('#imageFileUpload')
-            file_input.wait_for(timeout=10000)
+            await file_input.wait_for(state="attached", timeout=10000)
             
-            # Set file
-            file_input.set_input_files(file_path)
-            page.wait_for_timeout(1000)
+            # Set file from the in-memory bytes (no temp file round-trip)
+            await file_input.set_input_files({
+                "name": filename,
+                "mimeType": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                "buffer": content,
+            })
             
-            # Click upload button
+            # Click upload and wait for the form POST itself, not fixed sleeps
             upload_button = iframe_locator.locator('input[type="submit"][value="Upload"], button:has-text("Upload")')
-            upload_button.click()
+            form_action = await file_input.evaluate(FORM_ACTION_JS)
+            async with page.expect_response(upload_response_predicate(form_action), timeout=30000):
+                submitted = True
+                await upload_button.click()
             
-            # Wait for upload
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(2000)
-            
-            # Refresh page for next upload
-            page.reload()
-            page.wait_for_load_state("networkidle")
-            page.wait_for_selector('text=Upload Image', timeout=10000)
+            # Close the dialog for the next upload instead of reloading the page
+            await close_upload_dialog_async(page, iframe_locator)
             
             # Generate URL
             url = settings.luminate_image_base_url + filename
             
             # Verify upload
-            import requests
-            try:
-                response = requests.head(url, timeout=10, allow_redirects=True)
-                if response.status_code == 200:
-                    content_type = response.headers.get('content-type', '').lower()
-                    if content_type.startswith('image/'):
-                        return (True, url, None)
-            except:
-                pass
+            if await self._check_image_url(url, True):
+                return (True, url, None, submitted)
             
             # Try a few more times
             for _ in range(2):
-                page.wait_for_timeout(2000)
-                try:
-                    response = requests.head(url, timeout=10, allow_redirects=True)
-                    if response.status_code == 200:
-                        return (True, url, None)
-                except:
-                    pass
+                await asyncio.sleep(2)
+                if await self._check_image_url(url, False):
+                    return (True, url, None, submitted)
             
-            return (False, None, "Upload completed but verification failed")
+            return (False, None, VERIFY_FAILED_ERROR, submitted)
             
         except Exception as e:
-            return (False, None, str(e))
+            return (False, None, str(e), submitted)
+    
+    async def _check_image_url(self, url: str, require_image: bool) -> bool:
+        """HEAD the uploaded image URL over the shared keep-alive client.
+        
+        Concurrent checks share one pooled connection (multiplexed over
+        HTTP/2 when h2 is installed) instead of a new TLS handshake each.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=_HAS_H2,
+                timeout=10,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            )
+        try:
+            response = await self._http_client.head(url)
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '').lower()
+                return not require_image or content_type.startswith('image/')
+        except:
+            pass
+        return False
     
     async def _cleanup_browser(self, session: BrowserSession):
         """Close browser without removing session (for results access)."""
@@ -709,28 +975,40 @@ class BrowserSessionManager:
             pass
     
     async def _cleanup_session(self, session: BrowserSession):
-        """Full session cleanup including browser and temp files."""
+        """Full session cleanup including browser and file contents."""
         await self._cleanup_browser(session)
         
-        # Clean up temp directory
-        if session.temp_dir:
-            try:
-                shutil.rmtree(session.temp_dir, ignore_errors=True)
-            except:
-                pass
+        # Release the uploaded bytes
+        for job in session.resize_jobs:
+            if job is not None:
+                job.cancel()
+        session.resize_jobs = []
+        session.file_contents = []
     
     async def _cleanup_expired_sessions(self):
-        """Remove expired sessions."""
+        """Remove expired sessions.
+        
+        Finished (DONE/ERROR) sessions release their browser and file bytes
+        right away but stay listed until they expire. Login now runs in the
+        background, so polling is the only way the user sees its outcome, and
+        dropping the session early would turn a real error into "Session not
+        found or expired".
+        """
         async with self._lock:
             expired = [
                 sid for sid, session in self._sessions.items()
-                if session.is_expired or session.state in (SessionState.DONE, SessionState.ERROR, SessionState.CANCELLED)
+                if session.is_expired or session.state == SessionState.CANCELLED
             ]
             
-            for sid in expired:
-                session = self._sessions.pop(sid, None)
-                if session:
-                    await self._cleanup_session(session)
+            sessions = [self._sessions.pop(sid) for sid in expired]
+            sessions.extend(
+                session for session in self._sessions.values()
+                if session.state in (SessionState.DONE, SessionState.ERROR)
+                and (session.browser is not None or session.file_contents)
+            )
+        
+        # Close browsers concurrently, outside the lock so new sessions aren't blocked
+        await asyncio.gather(*(self._cleanup_session(session) for session in sessions))
 
 
 # Global browser manager instance
@@ -0,0 +1,57 @@
+"""
+Image Optimizer Service.
+
+Downscales oversized photos before they are uploaded to Luminate, so
+large phone images don't spend minutes crossing the uplink only to be
+displayed at a fraction of their size.
+"""
+
+import io
+
+
+# Formats we re-encode; anything else (e.g. animated GIFs) is left untouched
+RESIZABLE_FORMATS = {'JPEG', 'PNG'}
+DEFAULT_MAX_DIMENSION = 2048
+JPEG_QUALITY = 85
+
+
+def shrink_image(content: bytes, max_dim: int = DEFAULT_MAX_DIMENSION) -> bytes:
+    """
+    Downscale an image so neither side exceeds max_dim.
+
+    The original format is kept, since the Luminate URL is derived from
+    the filename. JPEGs are re-encoded at 85% quality (progressive). EXIF
+    orientation is applied before resizing so rotated photos stay upright.
+
+    Args:
+        content: Original image bytes
+        max_dim: Maximum width/height in pixels
+
+    Returns:
+        Resized image bytes, or the original bytes if the image is already
+        small enough, not a JPEG/PNG, or would not get any smaller
+    """
+    # Pillow is only loaded once someone actually asks for resizing
+    from PIL import Image, ImageOps
+    
+    try:
+        with Image.open(io.BytesIO(content)) as img:
+            fmt = img.format
+            if fmt not in RESIZABLE_FORMATS or max(img.size) <= max_dim:
+                return content
+
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+
+            buffer = io.BytesIO()
+            if fmt == 'JPEG':
+                if img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+                img.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+            else:
+                img.save(buffer, format='PNG', optimize=True)
+    except Exception:
+        return content
+
+    resized = buffer.getvalue()
+    return resized if len(resized) < len(content) else content
@@ -151,6 +151,41 @@ function validateFile(file, maxSizeMB = 10, allowedTypes = ['image/jpeg', 'image
     return errors;
 }
 
+/**
+ * Render selected files as "name (size MB)" list items.
+ * Names go in via textContent, so no HTML re-parse or escaping is needed,
+ * and the whole list lands in one DOM update. Large selections show the
+ * first FILE_LIST_LIMIT files plus a one-line summary of the rest.
+ */
+const FILE_LIST_LIMIT = 100;
+
+function renderFileList(listElement, files) {
+    const fragment = document.createDocumentFragment();
+    const shown = Array.from(files).slice(0, FILE_LIST_LIMIT);
+    for (const file of shown) {
+        const li = document.createElement('li');
+        const name = document.createElement('span');
+        name.className = 'text-gray-800';
+        name.textContent = file.name;
+        const size = document.createElement('span');
+        size.className = 'text-gray-500';
+        size.textContent = `(${(file.size / (1024 * 1024)).toFixed(2)} MB)`;
+        li.append(name, ' ', size);
+        fragment.appendChild(li);
+    }
+    if (files.length > shown.length) {
+        let hiddenBytes = 0;
+        for (let i = shown.length; i < files.length; i++) {
+            hiddenBytes += files[i].size;
+        }
+        const more = document.createElement('li');
+        more.className = 'text-gray-500 italic';
+        more.textContent = `…and ${files.length - shown.length} more (${(hiddenBytes / (1024 * 1024)).toFixed(2)} MB)`;
+        fragment.appendChild(more);
+    }
+    listElement.replaceChildren(fragment);
+}
+
 /**
  * Download text content as file
  */
@@ -166,6 +201,57 @@ function downloadAsFile(content, filename, mimeType = 'text/plain') {
     URL.revokeObjectURL(url);
 }
 
+/**
+ * Return the uploader to a fresh form without reloading the page
+ */
+function resetUploadForm() {
+    const form = document.getElementById('upload-form');
+    if (form) {
+        form.reset();
+        const submitBtn = form.querySelector('[type="submit"]');
+        if (submitBtn) {
+            submitBtn.disabled = false;
+            submitBtn.classList.remove('loading');
+        }
+    }
+    const fileList = document.getElementById('file-list');
+    if (fileList) {
+        fileList.classList.add('hidden');
+    }
+    const status = document.getElementById('upload-status');
+    if (status) {
+        status.replaceChildren();
+    }
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+
+/**
+ * Upload results: one delegated listener serves every URL row and
+ * button, including ones swapped in later by HTMX polling
+ */
+document.addEventListener('click', function(event) {
+    const row = event.target.closest('[data-copy-url]');
+    if (row) {
+        copyToClipboard(row.dataset.copyUrl, row);
+        return;
+    }
+    if (event.target.closest('[data-reset-upload]')) {
+        resetUploadForm();
+        return;
+    }
+    const button = event.target.closest('[data-copy-all-urls], [data-download-urls]');
+    if (button) {
+        // The server already rendered the joined list; reuse it as-is
+        const urlList = document.querySelector('[data-url-list]');
+        const urls = urlList ? urlList.textContent : '';
+        if ('copyAllUrls' in button.dataset) {
+            copyToClipboard(urls, button);
+        } else {
+            downloadAsFile(urls, 'uploaded_urls.txt');
+        }
+    }
+});
+
 /**
  * HTMX event handlers
  */
@@ -204,14 +290,7 @@ function handleBannerFileSelect(input) {
     
     if (bannerFiles.length > 0) {
         fileList.classList.remove('hidden');
-        fileListItems.innerHTML = '';
-        
-        bannerFiles.forEach(file => {
-            const sizeMB = (file.size / (1024 * 1024)).toFixed(2);
-            const li = document.createElement('li');
-            li.innerHTML = `<span class="text-gray-800">${file.name}</span> <span class="text-gray-500">(${sizeMB} MB)</span>`;
-            fileListItems.appendChild(li);
-        });
+        renderFileList(fileListItems, bannerFiles);
         
         previewBtn.disabled = false;
         processBtn.disabled = false;
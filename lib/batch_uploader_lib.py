@@ -16,9 +16,14 @@ from typing import Optional, Dict, List, Tuple, Any
 # Import from existing library
 from lib.luminate_uploader_lib import (
     _import_playwright,
+    STEALTH_SCRIPT,
+    _create_http_session,
+    _image_name,
+    _throttle_progress,
     ensure_playwright_browsers_installed,
     IMAGE_LIBRARY_URL,
     LOGIN_URL,
+    TWO_FACTOR_TEXT_RE,
     upload_image,
     navigate_to_image_library,
     validate_session,
@@ -155,11 +160,7 @@ def submit_2fa_code_robust(page, two_factor_code):
             
             # Check if 2FA prompt is still there (code might be invalid)
             page_content = page.content().lower()
-            two_factor_indicators = [
-                'two-factor', '2fa', 'verification code', 'authenticator',
-                'security code', 'enter code', 'verify your identity', 'additional-auth'
-            ]
-            still_has_2fa = any(indicator in page_content for indicator in two_factor_indicators)
+            still_has_2fa = TWO_FACTOR_TEXT_RE.search(page_content) is not None
             if still_has_2fa:
                 return (False, "Invalid 2FA code. Please try again.")
             else:
@@ -216,29 +217,11 @@ def create_browser_session():
         }
         
         context = browser.new_context(**context_options)
-        page = context.new_page()
         
         # Inject JavaScript to hide automation indicators
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-            window.chrome = {
-                runtime: {}
-            };
-        """)
+        context.add_init_script(STEALTH_SCRIPT)
+        
+        page = context.new_page()
         
         return (playwright_instance, browser, context, page)
         
@@ -315,18 +298,7 @@ def login_with_persistent_browser(page, username, password, two_factor_code=None
     current_url = page.url
     page_content = page.content().lower()
     
-    two_factor_indicators = [
-        'we sent a security code',  # Most specific - from actual 2FA page
-        'security code:',  # Label from 2FA form
-        'two-factor',
-        '2fa',
-        'verification code',
-        'authenticator',
-        'enter code',
-        'verify your identity'
-    ]
-    
-    has_2fa_prompt = any(indicator in page_content for indicator in two_factor_indicators)
+    has_2fa_prompt = TWO_FACTOR_TEXT_RE.search(page_content) is not None
     
     has_2fa_input = False
     try:
@@ -385,7 +357,7 @@ def login_with_persistent_browser(page, username, password, two_factor_code=None
     # Image Library failed - re-check page (we may have been redirected to 2FA or login)
     current_url = page.url
     page_content = page.content().lower()
-    has_2fa_prompt = any(indicator in page_content for indicator in two_factor_indicators)
+    has_2fa_prompt = TWO_FACTOR_TEXT_RE.search(page_content) is not None
     has_2fa_input = False
     try:
         auth_inputs = page.locator('input[name^="ADDITIONAL_AUTH"]')
@@ -440,7 +412,8 @@ def upload_with_persistent_browser(
     
     Args:
         page: Playwright page object (should already be authenticated)
-        image_paths: List of paths to image files
+        image_paths: List of paths to image files, or in-memory payload dicts
+            ({'name', 'mimeType', 'buffer'})
         progress_callback: Optional callback function(current, total, filename, status)
         
     Returns:
@@ -453,6 +426,7 @@ def upload_with_persistent_browser(
     successful = []
     failed = []
     urls = []
+    progress_callback = _throttle_progress(progress_callback)
     
     # Navigate to Image Library if not already there
     try:
@@ -462,25 +436,32 @@ def upload_with_persistent_browser(
     except:
         navigate_to_image_library(page)
     
-    # Upload each image
-    for i, image_path in enumerate(image_paths, 1):
-        filename = os.path.basename(image_path)
-        
-        if progress_callback:
-            progress_callback(i, len(image_paths), filename, "uploading")
-        
-        success, uploaded_filename, error, url = upload_image(page, image_path, verify=True)
-        
-        if success and url:
-            successful.append(uploaded_filename)
-            urls.append(url)
-            if progress_callback:
-                progress_callback(i, len(image_paths), filename, "success")
-        else:
-            error_msg = error or "Upload verification failed"
-            failed.append((filename, error_msg))
+    # One keep-alive HTTP session for every verification HEAD in this batch
+    http_session = _create_http_session()
+    try:
+        # Upload each image
+        for i, image_path in enumerate(image_paths, 1):
+            filename = _image_name(image_path)
+            
             if progress_callback:
-                progress_callback(i, len(image_paths), filename, "error")
+                progress_callback(i, len(image_paths), filename, "uploading")
+            
+            success, uploaded_filename, error, url = upload_image(
+                page, image_path, verify=True, session=http_session
+            )
+            
+            if success and url:
+                successful.append(uploaded_filename)
+                urls.append(url)
+                if progress_callback:
+                    progress_callback(i, len(image_paths), filename, "success")
+            else:
+                error_msg = error or "Upload verification failed"
+                failed.append((filename, error_msg))
+                if progress_callback:
+                    progress_callback(i, len(image_paths), filename, "error")
+    finally:
+        http_session.close()
     
     return {
         'successful': successful,
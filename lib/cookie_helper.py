@@ -21,6 +21,18 @@ LUMINATE_DOMAINS = [
     "convio.net",
 ]
 
+# Fields shared by every pasted name=value cookie (expiry is added per paste)
+_DEFAULT_COOKIE_FIELDS = {
+    'domain': 'secure2.convio.net',
+    'path': '/',
+    'secure': True,
+    'httpOnly': False,
+    'sameSite': 'Lax',
+}
+
+# Playwright cookie fields and the value used when an export omits one
+_PLAYWRIGHT_COOKIE_DEFAULTS = {'name': '', 'value': '', **_DEFAULT_COOKIE_FIELDS}
+
 
 def get_cookie_extraction_bookmarklet() -> str:
     """
@@ -186,27 +198,17 @@ def cookies_to_playwright_state(cookie_data: Dict[str, Any]) -> Dict[str, Any]:
         dict: Playwright-compatible storage state
     """
     cookies = cookie_data.get('cookies', [])
+    # Expiry for cookies that don't carry one (24 hours from now)
+    default_expires = time.time() + 86400
     
-    # Convert to Playwright format
-    playwright_cookies = []
-    for cookie in cookies:
-        pc = {
-            'name': cookie.get('name', ''),
-            'value': cookie.get('value', ''),
-            'domain': cookie.get('domain', 'secure2.convio.net'),
-            'path': cookie.get('path', '/'),
-            'secure': cookie.get('secure', True),
-            'httpOnly': cookie.get('httpOnly', False),
-            'sameSite': cookie.get('sameSite', 'Lax'),
+    # Convert to Playwright format: one defaults pass per cookie
+    playwright_cookies = [
+        {
+            **{key: cookie.get(key, default) for key, default in _PLAYWRIGHT_COOKIE_DEFAULTS.items()},
+            'expires': cookie.get('expires', default_expires),
         }
-        
-        # Add expiry if not present (set to 24 hours from now)
-        if 'expires' not in cookie:
-            pc['expires'] = time.time() + 86400
-        else:
-            pc['expires'] = cookie['expires']
-        
-        playwright_cookies.append(pc)
+        for cookie in cookies
+    ]
     
     return {
         'cookies': playwright_cookies,
@@ -268,28 +270,14 @@ def parse_simple_cookie_paste(text: str) -> Optional[List[Dict]]:
     Returns:
         List of cookie dicts or None if invalid
     """
-    cookies = []
+    # Shared fields plus an expiry computed once per paste
+    template = {**_DEFAULT_COOKIE_FIELDS, 'expires': time.time() + 86400}
     
-    for line in text.strip().split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        if '=' in line:
-            parts = line.split('=', 1)
-            name = parts[0].strip()
-            value = parts[1].strip() if len(parts) > 1 else ''
-            
-            if name:
-                cookies.append({
-                    'name': name,
-                    'value': value,
-                    'domain': 'secure2.convio.net',
-                    'path': '/',
-                    'secure': True,
-                    'httpOnly': False,
-                    'sameSite': 'Lax',
-                    'expires': time.time() + 86400
-                })
+    cookies = []
+    for line in text.splitlines():
+        name, sep, value = line.strip().partition('=')
+        name = name.strip()
+        if sep and name and not name.startswith('#'):
+            cookies.append({'name': name, 'value': value.strip(), **template})
     
     return cookies if cookies else None
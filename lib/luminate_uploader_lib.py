@@ -20,6 +20,21 @@ import sys
 import shutil
 import json
 import hashlib
+import functools
+import mimetypes
+import queue
+import asyncio
+import threading
+import atexit
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 # Playwright imports are lazy-loaded to prevent app crashes if dependencies are missing
 # Use _import_playwright() helper function to safely import Playwright when needed
@@ -33,6 +48,182 @@ BASE_URL = "https://danafarber.jimmyfund.org/images/content/pagebuilder/"
 AUTH_MODE_LOGIN = "login"  # Traditional username/password (may trigger 2FA)
 AUTH_MODE_COOKIES = "cookies"  # Use pre-authenticated cookies (bypasses 2FA)
 
+# Reported when an upload went through but its public URL never served an image
+VERIFY_FAILED_MESSAGE = (
+    "Upload completed but image URL is not accessible. This may indicate: "
+    "(1) file is still processing, (2) duplicate filename already exists, "
+    "or (3) upload failed silently."
+)
+
+# Parsed session states keyed by file path: {path: ((mtime_ns, size), state)}
+_STATE_CACHE = {}
+
+# Set once ensure_playwright_browsers_installed() has launched Chromium in this process
+_BROWSER_READY = False
+
+# Default Playwright timeouts, set once per browser context. Waits with no
+# explicit timeout use PLAYWRIGHT_TIMEOUT_MS (tunable via LUMINATE_PW_TIMEOUT_MS).
+PLAYWRIGHT_TIMEOUT_MS = int(os.environ.get('LUMINATE_PW_TIMEOUT_MS', '15000'))
+NAVIGATION_TIMEOUT_MS = 30000
+
+# Pages of the pooled browser context that upload a batch in parallel
+MAX_UPLOAD_WORKERS = 4
+
+# Upper bound for large batches (browsers stall beyond ~6 concurrent uploads)
+MAX_UPLOAD_CONCURRENCY = 6
+
+# Browser context options with a realistic fingerprint, shared by every context
+# of a batch and by the FastAPI browser manager. Copy ({**CONTEXT_OPTIONS}) before adding per-context keys such as
+# storage_state; the headers mapping is read-only so contexts cannot mutate it.
+CONTEXT_OPTIONS = {
+    # Use a realistic user agent (Chrome on Windows)
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    # Set realistic viewport size (common desktop resolution)
+    'viewport': {'width': 1920, 'height': 1080},
+    # Set locale and timezone (US-based defaults)
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York',
+    # Set color scheme preference
+    'color_scheme': 'light',
+    # Grant common permissions to appear more like a real browser
+    'permissions': ['geolocation'],
+    # Set extra HTTP headers that real browsers send
+    'extra_http_headers': MappingProxyType({
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0',
+    }),
+}
+
+# Anti-detection script registered once per browser context via
+# context.add_init_script(), so every page in the context picks it up
+STEALTH_SCRIPT = """
+// Override webdriver property
+Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+
+// Override plugins to appear more realistic
+Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+
+// Override languages
+Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+
+// Override permissions
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+);
+
+// Chrome runtime override
+window.chrome = { runtime: {} };
+"""
+
+# Requests the uploader never needs: the admin pages are driven, not looked at.
+# Stylesheets are kept because upload error detection relies on CSS visibility.
+BLOCKED_RESOURCE_TYPES = frozenset(('image', 'font', 'media'))
+BLOCKED_URL_PARTS = ('google-analytics', 'googletagmanager', 'doubleclick')
+
+# Session cookie lookup used by validate_session() for the fast liveness check
+LUMINATE_COOKIE_URL = "https://secure2.convio.net"
+SESSION_COOKIE_NAMES = ('sessionid', 'jsessionid', 'convio_session')
+
+# Messages upload_images_with_cookies() fails a whole batch with when the
+# session itself is rejected; upload_images_auto() logs in instead on these
+INVALID_COOKIES_MESSAGE = "Invalid cookie format"
+SESSION_EXPIRED_MESSAGE = (
+    "Session cookies are invalid or expired. "
+    "Please log into Luminate in your browser again and export fresh cookies."
+)
+SESSION_2FA_PENDING_MESSAGE = (
+    "2FA is still being requested. Your session cookies may not include the 2FA completion. "
+    "Please complete 2FA in your browser and export cookies again."
+)
+SESSION_NO_LIBRARY_MESSAGE = "Could not access Image Library. Session may be invalid."
+SESSION_REJECTED_MESSAGES = frozenset((
+    INVALID_COOKIES_MESSAGE,
+    SESSION_EXPIRED_MESSAGE,
+    SESSION_2FA_PENDING_MESSAGE,
+    SESSION_NO_LIBRARY_MESSAGE,
+))
+
+# 2FA prompt text, matched case-insensitively in one regex pass. Shared by
+# every login/session check here and in the batch uploader and FastAPI app.
+TWO_FACTOR_PATTERN = (
+    'two-factor|2fa|verification code|authenticator|security code|enter code|'
+    'enter the code|verify your identity|additional-auth|six-digit|6-digit|sms code|'
+    'text message'
+)
+TWO_FACTOR_TEXT_RE = re.compile(TWO_FACTOR_PATTERN, re.I)
+
+# login() has always also treated a bare "verification" as a 2FA prompt; too
+# broad for the after-submit checks, so only the login check uses it
+_LOGIN_TWO_FACTOR_TEXT_RE = re.compile(TWO_FACTOR_PATTERN + '|verification', re.I)
+
+# The same prompt as one browser-side selector: Luminate's ADDITIONAL_AUTH
+# code input, common OTP inputs or the prompt text. A single count() probe
+# replaces serializing the whole DOM back to Python.
+TWO_FACTOR_SELECTOR = (
+    'input[name^="ADDITIONAL_AUTH"], '
+    'input[autocomplete="one-time-code"], '
+    'input[name*="otp" i], '
+    'input[name*="2fa" i], '
+    f':text-matches("{TWO_FACTOR_PATTERN}", "i")'
+)
+
+# Browser launch failures caused by missing system libraries (matched on lowercased text)
+_MISSING_LIB_RE = re.compile(
+    r'cannot open shared object file|libnspr4\.so|shared libraries|no such file or directory'
+)
+
+# Post-upload error detection, joined once into a single CSS union selector.
+# The text patterns share one regex so each text node is tested once.
+UPLOAD_ERROR_PATTERN = "error|too large|already exists|duplicate|file size|exceed"
+UPLOAD_ERROR_SELECTORS = (
+    f':text-matches("{UPLOAD_ERROR_PATTERN}", "i")',
+    '.error',
+    '[class*="error"]',
+    '[id*="error"]',
+)
+UPLOAD_ERROR_UNION = ", ".join(UPLOAD_ERROR_SELECTORS)
+PAGE_ERROR_SELECTOR = 'text=/error|too large|already exists|duplicate/i'
+_VISIBLE_TEXT_JS = "els => els.filter(e => e.offsetParent !== null).map(e => e.innerText)"
+
+# Cookie uploads POST straight to the Image Library's upload form over HTTP
+# once the session is validated; anything the fast path cannot confirm falls
+# back to the browser. Set LUMINATE_DIRECT_UPLOAD=0 to always use the browser.
+DIRECT_UPLOAD_ENABLED = os.environ.get('LUMINATE_DIRECT_UPLOAD', '1') != '0'
+# Rejections that are final (retrying in the browser would fail the same way)
+_DIRECT_UPLOAD_REJECTED_RE = re.compile('too large|already exists|duplicate|exceed', re.I)
+# Text of the dialog's error elements (class or id containing "error") in a
+# POST response; only these are checked for rejections, never scripts or help text
+_DIRECT_UPLOAD_ERROR_ELEMENT_RE = re.compile(
+    r'<(\w+)\b[^>]*\b(?:class|id)\s*=\s*["\'][^"\']*error[^"\']*["\'][^>]*>(.*?)</\1\s*>',
+    re.I | re.S,
+)
+# Resolved action URL of the form a file input belongs to
+FORM_ACTION_JS = "input => input.form ? input.form.action : ''"
+# Action, non-file fields and file field name of the upload dialog's form
+_UPLOAD_FORM_JS = """form => {
+    const submit = form.querySelector('input[type="submit"][value="Upload"]');
+    const fileInput = form.querySelector('input[type="file"]');
+    return {
+        action: form.action,
+        fields: Array.from(form.elements)
+            .filter(e => e.name && !['file', 'submit', 'button', 'image', 'reset'].includes(e.type)
+                && (!['checkbox', 'radio'].includes(e.type) || e.checked))
+            .map(e => [e.name, e.value]),
+        fileField: fileInput ? fileInput.name : null,
+        submit: submit && submit.name ? [submit.name, submit.value] : null,
+    };
+}"""
+
 
 class TwoFactorAuthRequired(Exception):
     """Exception raised when 2FA is required during login."""
@@ -42,16 +233,26 @@ class TwoFactorAuthRequired(Exception):
         self.browser_state_path = browser_state_path
 
 
+@functools.lru_cache(maxsize=1)
 def is_streamlit_cloud():
-    """Check if running on Streamlit Cloud."""
+    """Check if running on Streamlit Cloud (evaluated once per process)."""
     return os.environ.get("STREAMLIT_SHARING_MODE") == "streamlit-cloud" or \
            os.path.exists("/app") or \
            "streamlit" in os.environ.get("HOSTNAME", "").lower()
 
 
+# Failed availability checks are re-probed at most this often
+PLAYWRIGHT_CHECK_TTL_SECONDS = 300
+_PLAYWRIGHT_CHECK = None  # (result tuple, checked_at)
+
+
+@functools.lru_cache(maxsize=None)
 def _import_playwright():
     """Safely import Playwright modules.
     
+    The successful result is cached; failures are not, so a later call can
+    succeed once Playwright has been installed.
+    
     Returns:
         tuple: (sync_playwright, PlaywrightTimeout, PlaywrightError) or raises ImportError
         
@@ -73,9 +274,46 @@ def _import_playwright():
         ) from e
 
 
+@functools.lru_cache(maxsize=None)
+def _import_async_playwright():
+    """Import Playwright's async API (cached like _import_playwright()).
+    
+    Returns:
+        async_playwright context manager factory
+        
+    Raises:
+        ImportError: If Playwright cannot be imported
+    """
+    try:
+        from playwright.async_api import async_playwright
+        return async_playwright
+    except ImportError as e:
+        raise ImportError(
+            "Playwright is not installed. Please install it with: pip install playwright && python -m playwright install chromium"
+        ) from e
+
+
+def _session_dir():
+    """Directory holding saved browser states (created with mode 700)."""
+    # Use temp directory for storage (works on both local and Cloud Run)
+    temp_dir = os.environ.get('TMPDIR', '/tmp')
+    if not os.path.exists(temp_dir):
+        temp_dir = '/tmp'
+    
+    # Create a subdirectory for our session files
+    session_dir = os.path.join(temp_dir, 'luminate_sessions')
+    os.makedirs(session_dir, mode=0o700, exist_ok=True)
+    return session_dir
+
+
+@functools.lru_cache(maxsize=256)
 def get_storage_state_path(username):
     """Generate secure file path for storing browser state.
     
+    Memoized per username, so the hash and directory checks run once per
+    process rather than on every state lookup; _write_state_file()
+    recreates the directory if it has since been cleaned away.
+    
     Args:
         username: Username to generate path for
         
@@ -84,17 +322,56 @@ def get_storage_state_path(username):
     """
     # Create a hash of the username for the filename (for security)
     username_hash = hashlib.sha256(username.encode()).hexdigest()[:16]
+    return os.path.join(_session_dir(), f'luminate_session_{username_hash}.json')
+
+
+def _dumps_state(state):
+    """Serialize a storage state dict to compact JSON bytes."""
+    if _HAS_ORJSON:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads_state(data):
+    """Parse storage state JSON bytes (raises json.JSONDecodeError on bad input)."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_state_file(state_path, state):
+    """Atomically write a storage state dict with user-only permissions.
     
-    # Use temp directory for storage (works on both local and Cloud Run)
-    temp_dir = os.environ.get('TMPDIR', '/tmp')
-    if not os.path.exists(temp_dir):
-        temp_dir = '/tmp'
-    
-    # Create a subdirectory for our session files
-    session_dir = os.path.join(temp_dir, 'luminate_sessions')
-    os.makedirs(session_dir, mode=0o700, exist_ok=True)
+    The payload goes to a sibling temp file created with mode 600 and is then
+    renamed over the target, so readers never see a half-written session.
+    """
+    payload = _dumps_state(state)
+    os.makedirs(os.path.dirname(state_path), mode=0o700, exist_ok=True)
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, state_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def get_2fa_state_path(username):
+    """Path of the temporary state file kept while a login waits for a 2FA code.
     
-    return os.path.join(session_dir, f'luminate_session_{username_hash}.json')
+    Args:
+        username: Username to generate path for
+        
+    Returns:
+        str: Path to the 2FA storage state file
+    """
+    state_path = get_storage_state_path(username)
+    return f"{state_path[:-len('.json')]}_2fa.json"
 
 
 def save_browser_state(context, username):
@@ -109,10 +386,10 @@ def save_browser_state(context, username):
     """
     try:
         state_path = get_storage_state_path(username)
-        context.storage_state(path=state_path)
         
-        # Set secure permissions (user read/write only)
-        os.chmod(state_path, 0o600)
+        # Serialize ourselves (compact JSON) instead of storage_state(path=...),
+        # file is created with user read/write only permissions
+        _write_state_file(state_path, context.storage_state())
         
         return state_path
     except Exception as e:
@@ -121,44 +398,83 @@ def save_browser_state(context, username):
         return None
 
 
-def load_browser_state(username):
-    """Load saved browser state if it exists.
+def _read_browser_state(username):
+    """Read and validate the saved browser state, reusing the parsed copy when unchanged.
+    
+    Parsed states are cached in memory keyed by file path and validated
+    against the file's mtime and size, so repeated batches in one process
+    skip the read and JSON parse.
     
     Args:
         username: Username to load state for
         
     Returns:
-        dict or None: Browser state dictionary if file exists and is valid, None otherwise
+        tuple: (state_path, state dict) or (None, None) if missing or invalid
     """
+    state_path = None
     try:
         state_path = get_storage_state_path(username)
         
-        if not os.path.exists(state_path):
-            return None
+        try:
+            file_stat = os.stat(state_path)
+        except FileNotFoundError:
+            _STATE_CACHE.pop(state_path, None)
+            return (None, None)
         
         # Check file permissions (should be 600)
-        file_stat = os.stat(state_path)
         if file_stat.st_mode & 0o077 != 0:
             # File has group/other permissions - consider it insecure, don't load
             print(f"Warning: Session file has insecure permissions, ignoring: {state_path}")
-            return None
+            return (None, None)
+        
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _STATE_CACHE.get(state_path)
+        if cached and cached[0] == cache_key:
+            return (state_path, cached[1])
         
         # Load and validate JSON
-        with open(state_path, 'r') as f:
-            state = json.load(f)
+        with open(state_path, 'rb') as f:
+            state = _loads_state(f.read())
         
         # Validate state structure
         if not isinstance(state, dict) or 'cookies' not in state:
             print(f"Warning: Invalid session state format, ignoring: {state_path}")
-            return None
+            return (None, None)
         
-        return state_path  # Return path, Playwright can load from path directly
+        _STATE_CACHE[state_path] = (cache_key, state)
+        return (state_path, state)
     except json.JSONDecodeError:
         print(f"Warning: Corrupted session state file, ignoring: {state_path}")
-        return None
+        return (None, None)
     except Exception as e:
         print(f"Warning: Failed to load browser state: {str(e)}")
-        return None
+        return (None, None)
+
+
+def load_browser_state(username):
+    """Load saved browser state if it exists.
+    
+    Args:
+        username: Username to load state for
+        
+    Returns:
+        str or None: Path to the state file if it exists and is valid, None otherwise
+    """
+    state_path, _ = _read_browser_state(username)
+    return state_path  # Return path, Playwright can load from path directly
+
+
+def load_browser_state_dict(username):
+    """Load saved browser state as a dict (served from memory when the file is unchanged).
+    
+    Args:
+        username: Username to load state for
+        
+    Returns:
+        dict or None: Storage state dict usable as Playwright's storage_state, None otherwise
+    """
+    _, state = _read_browser_state(username)
+    return state
 
 
 def clear_browser_state(username):
@@ -172,9 +488,11 @@ def clear_browser_state(username):
     """
     try:
         state_path = get_storage_state_path(username)
-        if os.path.exists(state_path):
-            os.remove(state_path)
-            return True
+        _STATE_CACHE.pop(state_path, None)
+        # One unlink syscall; a missing file just means there was no state
+        os.remove(state_path)
+        return True
+    except FileNotFoundError:
         return False
     except Exception as e:
         print(f"Warning: Failed to clear browser state: {str(e)}")
@@ -287,9 +605,8 @@ def submit_2fa_code(page, two_factor_code):
             if 'AdminLogin' not in current_url and 'login' not in current_url.lower():
                 # Check if we can access protected content
                 try:
-                    page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_selector('text=Upload Image', timeout=5000)
+                    page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+                    page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                     return (True, None)
                 except:
                     # Might still be authenticating, check again
@@ -297,26 +614,20 @@ def submit_2fa_code(page, two_factor_code):
                     current_url = page.url
                     if 'AdminLogin' not in current_url and 'login' not in current_url.lower():
                         try:
-                            page.wait_for_selector('text=Upload Image', timeout=5000)
+                            page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                             return (True, None)
                         except:
                             pass
             
             # Check if 2FA prompt is still there (code might be invalid)
-            page_content = page.content().lower()
-            two_factor_indicators = [
-                'two-factor', '2fa', 'verification code', 'authenticator',
-                'security code', 'enter code', 'verify your identity'
-            ]
-            still_has_2fa = any(indicator in page_content for indicator in two_factor_indicators)
+            still_has_2fa = bool(TWO_FACTOR_TEXT_RE.search(page.content()))
             if still_has_2fa:
                 return (False, "Invalid 2FA code. Please try again.")
             else:
                 # 2FA prompt gone, verify we're logged in
                 try:
-                    page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_selector('text=Upload Image', timeout=5000)
+                    page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+                    page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                     return (True, None)
                 except:
                     return (False, "2FA code submitted but authentication verification failed.")
@@ -397,23 +708,7 @@ def login(page, username, password, wait_for_2fa=True, max_2fa_wait_time=300, tw
     page_content = page.content().lower()
     
     # Check for 2FA indicators in page content
-    two_factor_indicators = [
-        'two-factor',
-        '2fa',
-        'verification code',
-        'authenticator',
-        'security code',
-        'enter code',
-        'verify your identity',
-        'verification',
-        'enter the code',
-        'six-digit',
-        '6-digit',
-        'text message',
-        'sms code'
-    ]
-    
-    has_2fa_prompt = any(indicator in page_content for indicator in two_factor_indicators)
+    has_2fa_prompt = _LOGIN_TWO_FACTOR_TEXT_RE.search(page_content) is not None
     
     # Also check for 2FA-specific HTML elements
     # Look for input fields that might be for 2FA codes (6-digit codes)
@@ -543,9 +838,8 @@ def login(page, username, password, wait_for_2fa=True, max_2fa_wait_time=300, tw
                     if 'AdminLogin' not in current_url and 'login' not in current_url.lower():
                         # Check if we can access protected content
                         try:
-                            page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-                            page.wait_for_load_state("networkidle")
-                            page.wait_for_selector('text=Upload Image', timeout=5000)
+                            page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+                            page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                             return (True, False, None)
                         except:
                             # Might still be authenticating, check again
@@ -553,22 +847,21 @@ def login(page, username, password, wait_for_2fa=True, max_2fa_wait_time=300, tw
                             current_url = page.url
                             if 'AdminLogin' not in current_url and 'login' not in current_url.lower():
                                 try:
-                                    page.wait_for_selector('text=Upload Image', timeout=5000)
+                                    page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                                     return (True, False, None)
                                 except:
                                     pass
                     
                     # Check if 2FA prompt is still there (code might be invalid)
                     page_content = page.content().lower()
-                    still_has_2fa = any(indicator in page_content for indicator in two_factor_indicators)
+                    still_has_2fa = TWO_FACTOR_TEXT_RE.search(page_content) is not None
                     if still_has_2fa:
                         return (False, True, "Invalid 2FA code. Please try again.")
                     else:
                         # 2FA prompt gone, verify we're logged in
                         try:
-                            page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-                            page.wait_for_load_state("networkidle")
-                            page.wait_for_selector('text=Upload Image', timeout=5000)
+                            page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+                            page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                             return (True, False, None)
                         except:
                             return (False, True, "2FA code submitted but authentication verification failed.")
@@ -595,9 +888,8 @@ def login(page, username, password, wait_for_2fa=True, max_2fa_wait_time=300, tw
                 # Check if we can see authenticated content
                 try:
                     # Try navigating to image library to confirm login
-                    page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_selector('text=Upload Image', timeout=5000)
+                    page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+                    page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                     # Successfully authenticated!
                     return (True, False, None)
                 except:
@@ -605,13 +897,12 @@ def login(page, username, password, wait_for_2fa=True, max_2fa_wait_time=300, tw
                     pass
             
             # Check if 2FA prompt is still visible
-            still_has_2fa = any(indicator in page_content for indicator in two_factor_indicators)
+            still_has_2fa = TWO_FACTOR_TEXT_RE.search(page_content) is not None
             if not still_has_2fa and 'AdminLogin' not in current_url:
                 # 2FA prompt gone and not on login page - might be authenticated
                 try:
-                    page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_selector('text=Upload Image', timeout=5000)
+                    page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+                    page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
                     return (True, False, None)
                 except:
                     pass
@@ -621,23 +912,47 @@ def login(page, username, password, wait_for_2fa=True, max_2fa_wait_time=300, tw
     
     # Verify login was successful by checking if we can access protected content
     try:
-        page.goto(IMAGE_LIBRARY_URL, timeout=10000)
-        page.wait_for_load_state("networkidle")
-        page.wait_for_selector('text=Upload Image', timeout=5000)
+        page.goto(IMAGE_LIBRARY_URL, timeout=10000, wait_until="domcontentloaded")
+        page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
         return (True, False, None)
     except Exception as e:
         return (False, False, f"Login verification failed: {str(e)}")
 
 
-def validate_session(page):
+def validate_session(page, confirm=False):
     """Validate if the current session is still active and authenticated.
     
+    A recognised Luminate session cookie that has already expired fails
+    immediately. With ``confirm`` False, a fresh one is trusted without
+    navigating. Otherwise, including when none of SESSION_COOKIE_NAMES is
+    present (the name list is not exhaustive), the Image Library is loaded
+    to check.
+    
     Args:
         page: Playwright page object
+        confirm: If True, always confirm by loading the Image Library
         
     Returns:
         bool: True if session is valid, False if expired or invalid
     """
+    try:
+        cookies = page.context.cookies(LUMINATE_COOKIE_URL)
+    except Exception as e:
+        print(f"Session validation error: {str(e)}")
+        return False
+    
+    session_cookie = next(
+        (c for c in cookies if c.get('name', '').lower() in SESSION_COOKIE_NAMES),
+        None
+    )
+    if session_cookie is not None:
+        # Playwright reports session cookies (no explicit expiry) as -1
+        expires = session_cookie.get('expires', -1)
+        if expires is not None and 0 < expires < time.time():
+            return False
+        if not confirm:
+            return True
+    
     try:
         # Try to navigate to a protected page (Image Library)
         page.goto(IMAGE_LIBRARY_URL, timeout=15000)
@@ -652,31 +967,22 @@ def validate_session(page):
         # Check for 2FA prompts
         try:
             # Look for common 2FA indicators
-            two_factor_indicators = [
-                'two-factor',
-                '2fa',
-                'verification code',
-                'authenticator',
-                'security code'
-            ]
             page_text = page.content().lower()
-            for indicator in two_factor_indicators:
-                if indicator in page_text:
-                    # Might be a 2FA prompt, but could also be in page content
-                    # Check if we can see the Upload Image button (means we're logged in)
-                    try:
-                        page.wait_for_selector('text=Upload Image', timeout=3000)
-                        # If we can see Upload Image, we're logged in (2FA was just text on page)
-                        break
-                    except:
-                        # Can't see Upload Image, might be 2FA prompt
-                        return False
+            if TWO_FACTOR_TEXT_RE.search(page_text):
+                # Might be a 2FA prompt, but could also be in page content
+                # Check if we can see the Upload Image button (means we're logged in)
+                try:
+                    page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=3000)
+                    # If we can see Upload Image, we're logged in (2FA was just text on page)
+                except:
+                    # Can't see Upload Image, might be 2FA prompt
+                    return False
         except:
             pass
         
         # Check if we can see the Upload Image button (confirms we're logged in)
         try:
-            page.wait_for_selector('text=Upload Image', timeout=5000)
+            page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
             return True
         except:
             # Can't find Upload Image button, session might be invalid
@@ -688,29 +994,65 @@ def validate_session(page):
 
 
 def navigate_to_image_library(page):
-    """Navigate to the Image Library."""
-    page.goto(IMAGE_LIBRARY_URL)
-    page.wait_for_load_state("networkidle")
+    """Navigate to the Image Library.
+    
+    Raises:
+        RuntimeError: If Luminate redirects to the login page (session expired)
+    """
+    # The Upload Image link is the readiness signal; no need to wait for
+    # background requests to settle
+    page.goto(IMAGE_LIBRARY_URL, wait_until="domcontentloaded")
+    
+    # Fail fast on a login redirect instead of timing out on the link below
+    current_url = page.url
+    if 'AdminLogin' in current_url or 'login' in current_url.lower():
+        raise RuntimeError("Redirected to the login page. The Luminate session has expired.")
     
     # Wait for the Upload Image button to be visible
-    page.wait_for_selector('text=Upload Image', timeout=10000)
+    page.get_by_role("link", name="Upload Image").wait_for(state='visible')
+
+
+def _create_http_session(pool_size=8):
+    """Create a keep-alive requests.Session for upload verification.
+    
+    One session per batch means one TLS handshake per host, not per file.
+    Dropped connections are retried by the adapter (idempotent methods only,
+    so upload POSTs are never replayed).
+    
+    Args:
+        pool_size: Number of pooled connections per host
+        
+    Returns:
+        requests.Session: Session with a sized connection pool mounted for http(s)
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
-def verify_upload(url, max_retries=3, retry_delay=2):
+def verify_upload(url, max_retries=3, retry_delay=2, session=None):
     """Verify that an uploaded image URL is accessible and returns an image.
     
     Args:
         url: The URL to verify
         max_retries: Maximum number of retry attempts
         retry_delay: Seconds to wait between retries
+        session: Optional requests.Session to reuse pooled connections
         
     Returns:
         bool: True if URL is accessible and returns an image, False otherwise
     """
+    http = session or requests
     
     for attempt in range(max_retries):
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
+            response = http.head(url, timeout=10, allow_redirects=True)
             # Check if it's a successful response and content type is an image
             if response.status_code == 200:
                 content_type = response.headers.get('content-type', '').lower()
@@ -733,17 +1075,65 @@ def verify_upload(url, max_retries=3, retry_delay=2):
     return False
 
 
+def verify_uploads(urls, max_retries=3, retry_delay=2, max_workers=8, session=None):
+    """Verify several uploaded image URLs concurrently.
+    
+    Args:
+        urls: List of URLs to verify
+        max_retries: Maximum number of retry attempts per URL
+        retry_delay: Seconds to wait between retries
+        max_workers: Maximum number of concurrent HEAD checks
+        session: Optional requests.Session shared by all checks
+        
+    Returns:
+        list: bool per URL, in the same order as urls
+    """
+    if not urls:
+        return []
+    # Without a caller's session, share one for the batch rather than one connection per URL
+    own_session = session is None
+    if own_session:
+        session = _create_http_session(pool_size=min(max_workers, len(urls)))
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(lambda url: verify_upload(url, max_retries, retry_delay, session=session), urls))
+    finally:
+        if own_session:
+            session.close()
+
+
+def _image_name(image):
+    """Filename of an image given as a path or an in-memory payload dict."""
+    if isinstance(image, dict):
+        return image['name']
+    return os.path.basename(image)
+
+
+def _image_input(image):
+    """Argument for set_input_files(): the payload dict as-is, or an absolute path."""
+    if isinstance(image, dict):
+        return image
+    return os.path.abspath(image)
+
+
 def check_file_size(image_path, max_size_mb=10):
     """Check if file size is within limits.
     
     Args:
-        image_path: Path to the image file
+        image_path: Path to the image file, or an in-memory payload dict
+            ({'name', 'mimeType', 'buffer'})
         max_size_mb: Maximum file size in MB (default 10MB)
         
     Returns:
         tuple: (is_valid: bool, error_message: str or None)
     """
-    file_size = os.path.getsize(image_path)
+    if isinstance(image_path, dict):
+        file_size = len(image_path['buffer'])
+    else:
+        try:
+            file_size = os.stat(image_path).st_size
+        except OSError as e:
+            return (False, f"Cannot read file: {e.strerror or str(e)}")
     file_size_mb = file_size / (1024 * 1024)
     
     if file_size_mb > max_size_mb:
@@ -752,22 +1142,134 @@ def check_file_size(image_path, max_size_mb=10):
     return (True, None)
 
 
-def upload_image(page, image_path, verify=True):
+def _filter_valid_sizes(image_paths, max_size_mb=10):
+    """Split image paths into uploadable files and size-check failures.
+    
+    Args:
+        image_paths: List of paths to image files and/or in-memory payload dicts
+        max_size_mb: Maximum file size in MB (default 10MB)
+        
+    Returns:
+        tuple: (valid_paths: list, failed: list of (filename, error) tuples)
+    """
+    # One os.stat per path (payload dicts are measured in memory)
+    checks = [check_file_size(p, max_size_mb=max_size_mb) for p in image_paths]
+    if all(size_valid for size_valid, _ in checks):
+        # Usual case: everything fits, so copy the list in one pre-sized step
+        return list(image_paths), []
+    valid_paths = [p for p, (size_valid, _) in zip(image_paths, checks) if size_valid]
+    failed = [
+        (_image_name(p), size_error)
+        for p, (size_valid, size_error) in zip(image_paths, checks) if not size_valid
+    ]
+    return valid_paths, failed
+
+
+def _apply_default_timeouts(context):
+    """Set the context-wide action and navigation timeouts (sync or async context)."""
+    context.set_default_timeout(PLAYWRIGHT_TIMEOUT_MS)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+
+
+def _is_blocked_request(request):
+    """Return True for media, font and analytics requests the uploader can skip."""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    url = request.url
+    return any(part in url for part in BLOCKED_URL_PARTS)
+
+
+def _block_heavy_resources(route):
+    """context.route() handler that aborts requests matched by _is_blocked_request()."""
+    if _is_blocked_request(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _block_heavy_resources_async(route):
+    """Async counterpart of _block_heavy_resources()."""
+    if _is_blocked_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _first_visible_text(locator):
+    """Return the first non-blank innerText among the locator's visible matches."""
+    for text in locator.evaluate_all(_VISIBLE_TEXT_JS):
+        if text and text.strip():
+            return text
+    return None
+
+
+def close_upload_dialog(page, iframe_locator):
+    """Close the upload dialog and wait for the Upload Image link to return.
+    
+    Falls back to reloading the Image Library only if the link does not
+    reappear after dismissing the dialog.
+    """
+    try:
+        close_button = iframe_locator.locator('button:has-text("Close"), [aria-label="Close"]')
+        if close_button.count() > 0:
+            close_button.first.click(timeout=2000)
+        else:
+            page.keyboard.press("Escape")
+    except:
+        try:
+            page.keyboard.press("Escape")
+        except:
+            pass
+    
+    try:
+        page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
+    except:
+        page.reload(wait_until="domcontentloaded")
+        page.get_by_role("link", name="Upload Image").wait_for(state='visible')
+
+
+def upload_response_predicate(form_action):
+    """Build an expect_response() predicate for the upload form's POST.
+    
+    Only a successful POST to the form's own action counts, so analytics
+    beacons or keep-alive POSTs cannot end the wait before the form submits.
+    
+    Args:
+        form_action: The upload form's resolved action URL (may be empty)
+        
+    Returns:
+        callable(response) -> bool
+    """
+    target = (form_action or '').split('?', 1)[0]
+    
+    def is_upload_response(response):
+        if response.request.method != "POST" or response.status >= 400:
+            return False
+        url = response.url.split('?', 1)[0]
+        # Without a resolved action, fall back to the upload endpoint's name
+        return url == target if target else 'upload' in url.lower()
+    
+    return is_upload_response
+
+
+def upload_image(page, image_path, verify=True, session=None):
     """Upload a single image to the Image Library.
     
     Args:
         page: Playwright page object
-        image_path: Path to the image file to upload
+        image_path: Path to the image file to upload, or an in-memory payload dict
+            ({'name', 'mimeType', 'buffer'})
         verify: Whether to verify the upload by checking the URL
+        session: Optional requests.Session used for the verification request
         
     Returns:
         tuple: (success: bool, filename: str, error: str or None, url: str or None)
     """
-    filename = os.path.basename(image_path)
-    abs_path = os.path.abspath(image_path)
+    filename = _image_name(image_path)
+    input_file = _image_input(image_path)
     
     # Check file size before attempting upload
-    size_valid, size_error = check_file_size(abs_path, max_size_mb=10)
+    size_valid, size_error = check_file_size(image_path, max_size_mb=10)
     if not size_valid:
         return (False, filename, size_error, None)
     
@@ -775,32 +1277,24 @@ def upload_image(page, image_path, verify=True):
         # Click the Upload Image button to open the dialog
         page.get_by_role("link", name="Upload Image").click()
         
-        # Wait for the dialog iframe to appear
-        page.wait_for_timeout(1500)
-        
         # The upload form is inside an iframe - we need to access it
         iframe_locator = page.frame_locator("iframe").last
         
-        # Wait for the file input to be ready inside the iframe
+        # Wait for the file input to be attached inside the dialog iframe
+        # (replaces a fixed sleep while the dialog opens)
         file_input = iframe_locator.locator('#imageFileUpload')
-        file_input.wait_for(timeout=10000)
+        file_input.wait_for(state='attached')
         
-        # Check for error messages in the iframe before uploading (like duplicate filename)
-        # This is a pre-check, but errors usually appear after upload attempt
+        # Set the file on the file input; the click below auto-waits for
+        # actionability so no extra settle time is needed
+        file_input.set_input_files(input_file)
         
-        # Set the file on the file input
-        file_input.set_input_files(abs_path)
-        
-        # Wait for the file to be selected
-        page.wait_for_timeout(1000)
-        
-        # Click the Upload button inside the iframe
+        # Click the Upload button inside the iframe and wait for the form POST
+        # to come back instead of waiting for the network to go idle
         upload_button = iframe_locator.locator('input[type="submit"][value="Upload"], button:has-text("Upload")')
-        upload_button.click()
-        
-        # Wait for the upload to complete - wait for network activity to finish
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
+        form_action = file_input.evaluate(FORM_ACTION_JS)
+        with page.expect_response(upload_response_predicate(form_action), timeout=30000):
+            upload_button.click()
         
         # Check for error messages after upload attempt
         # Look for common error patterns in the iframe
@@ -808,73 +1302,33 @@ def upload_image(page, image_path, verify=True):
         error_message = None
         
         try:
-            # Check for various error indicators
-            error_selectors = [
-                'text=/error/i',
-                'text=/too large/i',
-                'text=/already exists/i',
-                'text=/duplicate/i',
-                'text=/file size/i',
-                'text=/exceed/i',
-                '.error',
-                '[class*="error"]',
-                '[id*="error"]'
-            ]
-            
-            for selector in error_selectors:
-                try:
-                    error_elements = iframe_locator.locator(selector)
-                    if error_elements.count() > 0:
-                        # Get the error text
-                        error_text = error_elements.first
-                        if error_text.is_visible(timeout=1000):
-                            error_message = error_text.inner_text(timeout=1000)
-                            if error_message and len(error_message.strip()) > 0:
-                                error_detected = True
-                                break
-                except:
-                    continue
+            # One union selector, one round trip: collect the text of every
+            # visible match in the iframe instead of probing selectors one by one
+            error_message = _first_visible_text(iframe_locator.locator(UPLOAD_ERROR_UNION))
             
             # Also check the page itself for error messages
-            if not error_detected:
-                try:
-                    page_error = page.locator('text=/error|too large|already exists|duplicate/i')
-                    if page_error.count() > 0 and page_error.first.is_visible(timeout=1000):
-                        error_message = page_error.first.inner_text(timeout=1000)
-                        if error_message and len(error_message.strip()) > 0:
-                            error_detected = True
-                except:
-                    pass
+            if not error_message:
+                error_message = _first_visible_text(page.locator(PAGE_ERROR_SELECTOR))
             
+            error_detected = bool(error_message)
         except:
             pass  # Continue with upload verification
         
         if error_detected and error_message:
-            # Close dialog if still open
-            try:
-                page.keyboard.press("Escape")
-                page.wait_for_timeout(500)
-            except:
-                pass
-            page.reload()
-            page.wait_for_load_state("networkidle")
-            page.wait_for_selector('text=Upload Image', timeout=10000)
+            close_upload_dialog(page, iframe_locator)
             return (False, filename, f"Upload failed: {error_message.strip()}", None)
         
-        # After upload, refresh the page to ensure clean state for next upload
-        page.reload()
-        page.wait_for_load_state("networkidle")
-        
-        # Wait for the Upload Image link to be visible again
-        page.wait_for_selector('text=Upload Image', timeout=10000)
+        # Dismiss the dialog so the Image Library is ready for the next upload
+        # (no full page reload unless the dialog refuses to close)
+        close_upload_dialog(page, iframe_locator)
         
         # Generate URL and verify if requested
         url = generate_url(filename)
         if verify:
-            # Wait a moment for the image to be processed on the server
-            page.wait_for_timeout(3000)
-            if not verify_upload(url, max_retries=3, retry_delay=2):
-                return (False, filename, "Upload completed but image URL is not accessible. This may indicate: (1) file is still processing, (2) duplicate filename already exists, or (3) upload failed silently.", None)
+            # Poll the URL while the server finishes processing the image
+            # instead of sleeping a fixed amount up front
+            if not verify_upload(url, max_retries=6, retry_delay=1, session=session):
+                return (False, filename, VERIFY_FAILED_MESSAGE, None)
         
         return (True, filename, None, url)
         
@@ -891,6 +1345,146 @@ def generate_url(filename):
     return BASE_URL + filename
 
 
+def _discover_upload_form(page):
+    """Read the upload dialog's form so files can be POSTed without the browser.
+    
+    Args:
+        page: Playwright page on the Image Library with a valid session
+        
+    Returns:
+        dict with action, fields, fileField and submit, or None if the form
+        could not be read
+    """
+    try:
+        page.get_by_role("link", name="Upload Image").click()
+        iframe_locator = page.frame_locator("iframe").last
+        form = iframe_locator.locator('form:has(#imageFileUpload)')
+        form.wait_for(state='attached')
+        spec = form.evaluate(_UPLOAD_FORM_JS)
+        close_upload_dialog(page, iframe_locator)
+    except:
+        return None
+    if not spec.get('action') or not spec.get('fileField'):
+        return None
+    return spec
+
+
+def _upload_image_direct(session, form_spec, image_path):
+    """POST one image to the upload form and verify its URL.
+    
+    Args:
+        session: requests.Session carrying the Luminate session cookies
+        form_spec: Form description from _discover_upload_form()
+        image_path: Path to the image file to upload
+        
+    Returns:
+        tuple: (success, filename, error, url) like upload_image(), or None if
+        the POST never reached the server or the session was refused, so the
+        file should go through the browser
+    """
+    filename = _image_name(image_path)
+    mime_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if isinstance(image_path, dict):
+        mime_type = image_path.get('mimeType', mime_type)
+    data = list(form_spec['fields'])
+    if form_spec.get('submit'):
+        data.append(tuple(form_spec['submit']))
+    
+    try:
+        # Payload dicts already hold the bytes; paths are opened for the POST
+        if isinstance(image_path, dict):
+            file_source = contextlib.nullcontext(image_path['buffer'])
+        else:
+            file_source = open(image_path, 'rb')
+        with file_source as f:
+            response = session.post(
+                form_spec['action'],
+                data=data,
+                files={form_spec['fileField']: (filename, f, mime_type)},
+                timeout=60,
+            )
+    except (OSError, requests.RequestException):
+        return None
+    
+    # Logged out or refused: let the browser path deal with it
+    if response.status_code in (401, 403) or 'AdminLogin' in response.url:
+        return None
+    if response.status_code >= 400:
+        return (False, filename, f"Upload failed: HTTP {response.status_code}", None)
+    
+    url = generate_url(filename)
+    if verify_upload(url, session=session):
+        return (True, filename, None, url)
+    
+    # The POST was accepted, so never resubmit (that could duplicate the file);
+    # report a rejection from the dialog's error element if it shows one
+    for _, error_text in _DIRECT_UPLOAD_ERROR_ELEMENT_RE.findall(response.text):
+        rejected = _DIRECT_UPLOAD_REJECTED_RE.search(error_text)
+        if rejected:
+            return (False, filename, f"Upload failed: {rejected.group(0).lower()}", None)
+    return (False, filename, VERIFY_FAILED_MESSAGE, None)
+
+
+def _upload_images_direct(storage_state, form_spec, image_paths, progress_callback=None,
+                          http_session=None, max_workers=MAX_UPLOAD_WORKERS):
+    """Upload images with direct multipart POSTs, concurrently.
+    
+    Args:
+        storage_state: Playwright storage state dict whose cookies authenticate the POSTs
+        form_spec: Form description from _discover_upload_form()
+        image_paths: List of paths to image files
+        progress_callback: Optional callback function(current, total, filename, status)
+        http_session: Optional requests.Session to reuse (cookies are added to it)
+        max_workers: Maximum number of simultaneous POSTs
+        
+    Returns:
+        tuple: (successful, failed, urls, leftover_paths) where leftover_paths
+        still need the browser upload path
+    """
+    session = http_session or _create_http_session()
+    for cookie in storage_state.get('cookies', []):
+        session.cookies.set(
+            cookie['name'], cookie['value'],
+            domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+        )
+    
+    total = len(image_paths)
+    results = [None] * total
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+            futures = {
+                executor.submit(_upload_image_direct, session, form_spec, path): index
+                for index, path in enumerate(image_paths)
+            }
+            finished = 0
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if result is not None and progress_callback:
+                    finished += 1
+                    progress_callback(finished, total, result[1], "success" if result[0] else "error")
+    finally:
+        if http_session is None:
+            session.close()
+    
+    successful = []
+    failed = []
+    urls = []
+    leftover = []
+    for image_path, result in zip(image_paths, results):
+        if result is None:
+            leftover.append(image_path)
+            continue
+        success, filename, error, url = result
+        if success:
+            successful.append(filename)
+            urls.append(url)
+        else:
+            failed.append((filename, error))
+    
+    return successful, failed, urls, leftover
+
+
 def check_playwright_available():
     """Check if Playwright is available and can be used.
     
@@ -899,11 +1493,20 @@ def check_playwright_available():
     to show appropriate status messages. The actual browser check happens
     when upload is attempted.
     
+    UIs call this on every rerun, so a failed import is remembered for
+    PLAYWRIGHT_CHECK_TTL_SECONDS instead of re-scanning sys.path each time.
+    
     Returns:
         tuple: (available: bool, error_message: str or None)
         - available: True if Playwright can be imported, False otherwise
         - error_message: None if available, otherwise a user-friendly error message
     """
+    global _PLAYWRIGHT_CHECK
+    if _PLAYWRIGHT_CHECK is not None:
+        result, checked_at = _PLAYWRIGHT_CHECK
+        if time.time() - checked_at < PLAYWRIGHT_CHECK_TTL_SECONDS:
+            return result
+    
     try:
         # Just check if Playwright can be imported - don't try to initialize it
         # Initialization might access system libraries that aren't available
@@ -912,14 +1515,53 @@ def check_playwright_available():
         
         # If import succeeds, assume it's available
         # We'll catch actual browser/system dependency errors when trying to use it
-        return (True, None)
+        result = (True, None)
         
     except ImportError as e:
-        return (False, "Playwright is not installed. Browser automation is not available.")
+        result = (False, "Playwright is not installed. Browser automation is not available.")
     except RuntimeError as e:
-        return (False, f"Playwright setup error: {str(e)}")
+        result = (False, f"Playwright setup error: {str(e)}")
     except Exception as e:
-        return (False, f"Unexpected error checking Playwright: {str(e)}")
+        result = (False, f"Unexpected error checking Playwright: {str(e)}")
+    
+    _PLAYWRIGHT_CHECK = (result, time.time())
+    return result
+
+
+def _run_playwright_cli(*args, timeout=300):
+    """Run a Playwright CLI command through the bundled driver.
+    
+    Invokes the Node driver directly instead of spawning a second Python
+    interpreter via ``python -m playwright``, falling back to that form if
+    the driver location cannot be resolved.
+    
+    Args:
+        *args: CLI arguments, e.g. ("install", "chromium")
+        timeout: Seconds before the command is abandoned (default 5 minutes)
+        
+    Returns:
+        subprocess.CompletedProcess
+        
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero
+        subprocess.TimeoutExpired: If the command exceeds the timeout
+    """
+    env = None
+    try:
+        from playwright._impl._driver import compute_driver_executable, get_driver_env
+        driver = compute_driver_executable()
+        command = [str(part) for part in driver] if isinstance(driver, tuple) else [str(driver)]
+        env = get_driver_env()
+    except Exception:
+        command = [sys.executable, "-m", "playwright"]
+    
+    return subprocess.run(
+        [*command, *args],
+        env=env,
+        check=True,
+        capture_output=True,
+        timeout=timeout
+    )
 
 
 def ensure_playwright_browsers_installed(progress_callback=None):
@@ -936,6 +1578,12 @@ def ensure_playwright_browsers_installed(progress_callback=None):
         ImportError: If Playwright cannot be imported
         RuntimeError: If system dependencies are missing
     """
+    global _BROWSER_READY
+    
+    # A probe launch already succeeded in this process - skip the launch/close cycle
+    if _BROWSER_READY:
+        return True
+    
     # Lazy import Playwright
     try:
         sync_playwright, _, _ = _import_playwright()
@@ -947,19 +1595,15 @@ def ensure_playwright_browsers_installed(progress_callback=None):
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             browser.close()
+        _BROWSER_READY = True
         return True
     except Exception as e:
+        _BROWSER_READY = False
         error_str = str(e).lower()
         error_message = str(e)
         
         # Check if it's a missing system library error (like libnspr4.so)
-        missing_lib_indicators = [
-            "cannot open shared object file",
-            "libnspr4.so",
-            "shared libraries",
-            "no such file or directory"
-        ]
-        is_missing_lib = any(indicator in error_message.lower() for indicator in missing_lib_indicators)
+        is_missing_lib = bool(_MISSING_LIB_RE.search(error_str))
         
         # Check if it's a browser installation error
         is_browser_missing = "executable doesn't exist" in error_str or "browsers" in error_str
@@ -972,12 +1616,7 @@ def ensure_playwright_browsers_installed(progress_callback=None):
                         progress_callback(0, 0, "Installing Playwright system dependencies...", "info")
                     try:
                         # Install system dependencies for Chromium
-                        subprocess.run(
-                            [sys.executable, "-m", "playwright", "install-deps", "chromium"],
-                            check=True,
-                            capture_output=True,
-                            timeout=300  # 5 minute timeout
-                        )
+                        _run_playwright_cli("install-deps", "chromium")
                     except subprocess.CalledProcessError as deps_error:
                         # System dependencies installation might fail in restricted environments
                         # (like Streamlit Cloud), but we'll continue to try installing browsers
@@ -990,12 +1629,7 @@ def ensure_playwright_browsers_installed(progress_callback=None):
                 # Then install browser binaries
                 if progress_callback:
                     progress_callback(0, 0, "Installing Playwright browsers...", "info")
-                subprocess.run(
-                    [sys.executable, "-m", "playwright", "install", "chromium"],
-                    check=True,
-                    capture_output=True,
-                    timeout=300  # 5 minute timeout
-                )
+                _run_playwright_cli("install", "chromium")
                 
                 # Try launching again after installation
                 try:
@@ -1003,11 +1637,12 @@ def ensure_playwright_browsers_installed(progress_callback=None):
                     with sync_playwright() as p:
                         browser = p.chromium.launch(headless=True)
                         browser.close()
+                    _BROWSER_READY = True
                     return True
                 except Exception as retry_error:
                     # If it still fails after installation, it's likely a system dependency issue
                     retry_error_str = str(retry_error).lower()
-                    if is_missing_lib or any(indicator in retry_error_str for indicator in missing_lib_indicators):
+                    if is_missing_lib or _MISSING_LIB_RE.search(retry_error_str):
                         # Provide environment-specific guidance
                         if is_streamlit_cloud():
                             error_msg = (
@@ -1045,15 +1680,441 @@ def ensure_playwright_browsers_installed(progress_callback=None):
             raise
 
 
-def upload_images_batch(username, password, image_paths, progress_callback=None, two_factor_code=None):
+async def _first_visible_text_async(locator):
+    """Async counterpart of _first_visible_text()."""
+    for text in await locator.evaluate_all(_VISIBLE_TEXT_JS):
+        if text and text.strip():
+            return text
+    return None
+
+
+async def close_upload_dialog_async(page, iframe_locator):
+    """Async counterpart of close_upload_dialog()."""
+    try:
+        close_button = iframe_locator.locator('button:has-text("Close"), [aria-label="Close"]')
+        if await close_button.count() > 0:
+            await close_button.first.click(timeout=2000)
+        else:
+            await page.keyboard.press("Escape")
+    except:
+        try:
+            await page.keyboard.press("Escape")
+        except:
+            pass
+    
+    try:
+        await page.get_by_role("link", name="Upload Image").wait_for(state='visible', timeout=5000)
+    except:
+        await page.reload(wait_until="domcontentloaded")
+        await page.get_by_role("link", name="Upload Image").wait_for(state='visible')
+
+
+async def _upload_image_async(page, image_path):
+    """Upload a single image with the async API (no URL verification).
+    
+    Mirrors upload_image(page, image_path, verify=False); verification is
+    left to the caller so it can be batched.
+    
+    Args:
+        page: Playwright async page already on the Image Library
+        image_path: Path to the image file to upload
+        
+    Returns:
+        tuple: (success: bool, filename: str, error: str or None, url: str or None)
+    """
+    filename = _image_name(image_path)
+    input_file = _image_input(image_path)
+    
+    try:
+        await page.get_by_role("link", name="Upload Image").click()
+        
+        iframe_locator = page.frame_locator("iframe").last
+        file_input = iframe_locator.locator('#imageFileUpload')
+        await file_input.wait_for(state='attached')
+        await file_input.set_input_files(input_file)
+        
+        upload_button = iframe_locator.locator('input[type="submit"][value="Upload"], button:has-text("Upload")')
+        form_action = await file_input.evaluate(FORM_ACTION_JS)
+        async with page.expect_response(upload_response_predicate(form_action), timeout=30000):
+            await upload_button.click()
+        
+        error_message = None
+        try:
+            error_message = await _first_visible_text_async(iframe_locator.locator(UPLOAD_ERROR_UNION))
+            if not error_message:
+                error_message = await _first_visible_text_async(page.locator(PAGE_ERROR_SELECTOR))
+        except:
+            pass  # Continue with upload verification
+        
+        await close_upload_dialog_async(page, iframe_locator)
+        
+        if error_message:
+            return (False, filename, f"Upload failed: {error_message.strip()}", None)
+        
+        return (True, filename, None, generate_url(filename))
+        
+    except Exception as e:
+        error_str = str(e).lower()
+        if "timeout" in error_str:
+            return (False, filename, f"Timeout: {str(e)}", None)
+        return (False, filename, str(e), None)
+
+
+async def _upload_images_in_context(context, image_paths, progress_callback=None,
+                                    max_concurrency=MAX_UPLOAD_WORKERS, result_callback=None):
+    """Upload images concurrently from pages of an authenticated async context.
+    
+    Opens up to max_concurrency pages on the Image Library, bounded by an
+    asyncio.Semaphore, and closes them afterwards; the context is left open.
+    Progress counts follow the order files start and finish, not their
+    position in image_paths, so a progress bar only ever moves forward.
+    
+    Args:
+        context: Playwright async BrowserContext carrying the session cookies
+        image_paths: List of paths to image files
+        progress_callback: Optional callback function(current, total, filename, status),
+            called on the event loop thread
+        max_concurrency: Maximum number of simultaneous uploads
+        result_callback: Optional callback function(index, result) called as each
+            upload finishes, on the event loop thread
+        
+    Returns:
+        list: upload result tuple per path, in image_paths order
+    """
+    total = len(image_paths)
+    if not total:
+        return []
+    page_count = min(max_concurrency, total)
+    semaphore = asyncio.Semaphore(page_count)
+    
+    async def open_library_page():
+        page = await context.new_page()
+        await page.goto(IMAGE_LIBRARY_URL, wait_until="domcontentloaded")
+        await page.get_by_role("link", name="Upload Image").wait_for(state='visible')
+        return page
+    
+    opened = await asyncio.gather(*(open_library_page() for _ in range(page_count)), return_exceptions=True)
+    pages = asyncio.Queue()
+    # Callbacks all run on this event loop thread, so plain counters are safe
+    started = 0
+    finished = 0
+    try:
+        for page in opened:
+            if isinstance(page, BaseException):
+                raise page
+            pages.put_nowait(page)
+        
+        async def upload_one(index, image_path):
+            nonlocal started, finished
+            async with semaphore:
+                page = await pages.get()
+                try:
+                    filename = _image_name(image_path)
+                    started += 1
+                    if progress_callback:
+                        progress_callback(started, total, filename, "uploading")
+                    result = await _upload_image_async(page, image_path)
+                    finished += 1
+                    if not result[0] and progress_callback:
+                        progress_callback(finished, total, filename, "error")
+                    if result_callback:
+                        result_callback(index, result)
+                    return result
+                finally:
+                    pages.put_nowait(page)
+        
+        return await asyncio.gather(*(upload_one(i, path) for i, path in enumerate(image_paths)))
+    finally:
+        for page in opened:
+            if not isinstance(page, BaseException):
+                try:
+                    await page.close()
+                except:
+                    pass
+
+
+class _BrowserPool:
+    """Process-wide async Chromium kept alive between upload batches.
+    
+    The browser lives on a dedicated event loop thread, so any caller thread
+    can submit work to it. Authenticated contexts are cached by a fingerprint
+    of their storage state and closed once idle for CONTEXT_TTL seconds.
+    Batches that pass a user key retire that user's previous context as soon
+    as it is idle, so a fresh login replaces the old one instead of both
+    staying open until the TTL.
+    """
+    
+    CONTEXT_TTL = 600
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._launch_lock = None
+        # {fingerprint: [context, last_used, active_batches]}
+        self._contexts = {}
+        # {user_key: fingerprint of that user's latest context}
+        self._user_contexts = {}
+    
+    def submit(self, coro):
+        """Schedule a coroutine on the pool's event loop thread.
+        
+        Returns:
+            concurrent.futures.Future: Resolves with the coroutine's result
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="luminate-browser-pool", daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    @staticmethod
+    def fingerprint(storage_state):
+        """Return a short stable hash identifying a storage state."""
+        return hashlib.sha256(json.dumps(storage_state, sort_keys=True).encode()).hexdigest()[:16]
+    
+    async def _get_browser(self):
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await _import_async_playwright()().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                self._contexts.clear()
+                self._user_contexts.clear()
+        return self._browser
+    
+    async def _evict_idle(self):
+        now = time.monotonic()
+        for key, (context, last_used, active) in list(self._contexts.items()):
+            if not active and now - last_used > self.CONTEXT_TTL:
+                del self._contexts[key]
+                try:
+                    await context.close()
+                except:
+                    pass
+    
+    async def upload(self, storage_state, image_paths, progress_callback=None,
+                     max_concurrency=MAX_UPLOAD_WORKERS, result_callback=None, user_key=None):
+        """Upload images using a cached context for storage_state (runs on the pool loop)."""
+        browser = await self._get_browser()
+        
+        key = self.fingerprint(storage_state)
+        if user_key is not None:
+            previous = self._user_contexts.get(user_key)
+            self._user_contexts[user_key] = key
+            stale = self._contexts.get(previous) if previous != key else None
+            if stale is not None:
+                # Expire it now; it closes here or after its running batch
+                stale[1] = float('-inf')
+        await self._evict_idle()
+        
+        entry = self._contexts.get(key)
+        if entry is None:
+            context = await browser.new_context(storage_state=storage_state, **CONTEXT_OPTIONS)
+            await context.add_init_script(STEALTH_SCRIPT)
+            await context.route("**/*", _block_heavy_resources_async)
+            _apply_default_timeouts(context)
+            # Another batch may have created the same context meanwhile; keep the first
+            entry = self._contexts.setdefault(key, [context, time.monotonic(), 0])
+            if entry[0] is not context:
+                await context.close()
+        
+        entry[2] += 1
+        try:
+            return await _upload_images_in_context(
+                entry[0], image_paths, progress_callback, max_concurrency, result_callback
+            )
+        finally:
+            # A retired context keeps its expired timestamp so the next batch closes it
+            if entry[1] > float('-inf'):
+                entry[1] = time.monotonic()
+            entry[2] -= 1
+    
+    async def _shutdown(self):
+        for context, _, _ in self._contexts.values():
+            try:
+                await context.close()
+            except:
+                pass
+        self._contexts.clear()
+        self._user_contexts.clear()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except:
+                pass
+            self._playwright = None
+        self._launch_lock = None
+    
+    def close(self):
+        """Close every cached context, the browser and the event loop thread."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_BROWSER_POOL = _BrowserPool()
+atexit.register(_BROWSER_POOL.close)
+
+
+def _throttle_progress(progress_callback, min_interval=0.1):
+    """Wrap a progress callback so "uploading" updates fire at most every min_interval seconds.
+    
+    Every other status (success, error, info) and the last file's update
+    always pass through, so no outcome is lost; only bursts of intermediate
+    "uploading" ticks, each a UI rerender on Streamlit, are collapsed.
+    
+    Args:
+        progress_callback: Callback function(current, total, filename, status) or None
+        min_interval: Minimum seconds between forwarded "uploading" updates
+        
+    Returns:
+        Wrapped callback, or None if progress_callback is None
+    """
+    if progress_callback is None:
+        return None
+    last_emit = [0.0]
+    
+    def throttled(current, total, filename, status):
+        now = time.monotonic()
+        if status != "uploading" or current == total or now - last_emit[0] >= min_interval:
+            last_emit[0] = now
+            progress_callback(current, total, filename, status)
+    
+    return throttled
+
+
+def _upload_images_parallel(storage_state, image_paths, progress_callback=None, http_session=None,
+                            max_concurrency=MAX_UPLOAD_WORKERS, max_verify_workers=8, user_key=None,
+                            progress_offset=0, progress_total=None):
+    """Upload a batch of images concurrently, verifying each URL as soon as its upload lands.
+    
+    Uploads run on the shared _BROWSER_POOL, whose browser and per-session
+    contexts stay alive between calls, so repeat batches skip Chromium
+    startup. Each finished upload is handed straight to a verification
+    thread, so HEAD checks overlap the remaining uploads instead of waiting
+    for the whole batch. Progress callbacks are relayed back and dispatched
+    from the calling thread so UI callbacks (e.g. Streamlit) never run on the
+    pool's event loop thread.
+    
+    Args:
+        storage_state: Playwright storage state dict from the authenticated context
+        image_paths: List of paths to image files
+        progress_callback: Optional callback function(current, total, filename, status)
+        http_session: Optional requests.Session used for URL verification
+        max_concurrency: Maximum number of simultaneous uploads
+        max_verify_workers: Maximum number of concurrent verification requests
+        user_key: Optional stable identity (e.g. username) whose previous
+            pooled context is retired once this batch's context replaces it
+        progress_offset: Files of the caller's batch already reported, added
+            to every progress count
+        progress_total: Size of the caller's whole batch (default len(image_paths))
+        
+    Returns:
+        tuple: (successful, failed, urls) in the original image_paths order
+    """
+    total = len(image_paths)
+    report_total = progress_total or total
+    events = queue.Queue()
+    
+    def relay(current, _total, filename, status):
+        events.put(("progress", current, filename, status))
+    
+    def on_result(index, result):
+        events.put(("uploaded", index, result))
+    
+    def dispatch(event):
+        kind, first, second, *rest = event
+        if kind == "progress":
+            if progress_callback:
+                progress_callback(progress_offset + first, report_total, second, rest[0])
+            return
+        results[first] = second
+        if second[0] and second[3]:
+            verifications[first] = verifier.submit(verify_upload, second[3], session=http_session)
+    
+    results = [None] * total
+    verifications = {}
+    with ThreadPoolExecutor(max_workers=min(max_verify_workers, total)) as verifier:
+        future = _BROWSER_POOL.submit(
+            _BROWSER_POOL.upload(storage_state, image_paths, relay, max_concurrency, on_result, user_key)
+        )
+        while True:
+            try:
+                event = events.get(timeout=0.1)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            dispatch(event)
+        
+        # Flush events queued between the last poll and the upload finishing
+        while not events.empty():
+            dispatch(events.get_nowait())
+        
+        upload_error = future.exception()
+        
+        if progress_callback and not all(f.done() for f in verifications.values()):
+            progress_callback(progress_offset, report_total, "Verifying uploaded images...", "info")
+        verified = {index: f.result() for index, f in verifications.items()}
+    
+    successful = []
+    failed = []
+    urls = []
+    reported = 0
+    for index, (image_path, result) in enumerate(zip(image_paths, results)):
+        filename = _image_name(image_path)
+        if result is None:
+            reason = upload_error or "upload stopped before this file"
+            failed.append((filename, f"Upload error: {reason}"))
+            continue
+        success, uploaded_filename, error, url = result
+        if index in verified:
+            reported += 1
+            if verified[index]:
+                successful.append(uploaded_filename)
+                urls.append(url)
+                if progress_callback:
+                    progress_callback(progress_offset + reported, report_total, filename, "success")
+            else:
+                failed.append((filename, VERIFY_FAILED_MESSAGE))
+                if progress_callback:
+                    progress_callback(progress_offset + reported, report_total, filename, "error")
+        else:
+            failed.append((filename, error or "Upload verification failed"))
+    
+    return successful, failed, urls
+
+
+def upload_images_batch(username, password, image_paths, progress_callback=None, two_factor_code=None,
+                        concurrency=None):
     """Upload multiple images to Luminate Online.
     
     Args:
         username: Luminate username
         password: Luminate password
-        image_paths: List of paths to image files
+        image_paths: List of paths to image files, or in-memory payload dicts
+            ({'name', 'mimeType', 'buffer'}) so callers can skip writing temp files
         progress_callback: Optional callback function(current, total, filename, status)
         two_factor_code: Optional 6-digit 2FA code if 2FA is required
+        concurrency: Optional number of simultaneous uploads (default MAX_UPLOAD_WORKERS)
         
     Returns:
         dict: {
@@ -1068,6 +2129,18 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
     successful = []
     failed = []
     urls = []
+    progress_callback = _throttle_progress(progress_callback)
+    
+    # Reject oversized files before paying for browser startup and login
+    image_paths, failed = _filter_valid_sizes(image_paths)
+    if not image_paths:
+        return {
+            'successful': successful,
+            'failed': failed,
+            'urls': urls
+        }
+    # Basenames for the error paths that fail the whole batch at once
+    filenames = [_image_name(p) for p in image_paths]
     
     # Ensure Playwright browsers are installed before attempting to use them
     try:
@@ -1077,9 +2150,7 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                 "Please run: python -m playwright install chromium"
             )
             # Mark all images as failed with this error
-            for image_path in image_paths:
-                filename = os.path.basename(image_path)
-                failed.append((filename, error_msg))
+            failed.extend((filename, error_msg) for filename in filenames)
             return {
                 'successful': successful,
                 'failed': failed,
@@ -1095,9 +2166,7 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                 "If you're using Streamlit Cloud, please contact support or check the deployment logs. "
                 "The app may need to be configured with additional system dependencies."
             )
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
         return {
             'successful': successful,
             'failed': failed,
@@ -1112,9 +2181,7 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                 "\n\nMissing system library detected. This may require system-level dependencies "
                 "to be installed in the deployment environment."
             )
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
         return {
             'successful': successful,
             'failed': failed,
@@ -1126,15 +2193,14 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
         sync_playwright, _, PlaywrightError = _import_playwright()
     except (ImportError, RuntimeError) as e:
         error_msg = f"Cannot use browser automation: {str(e)}"
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
         return {
             'successful': successful,
             'failed': failed,
             'urls': urls
         }
     
+    browser = None
     try:
         with sync_playwright() as p:
             # Launch browser in headless mode (better for web apps)
@@ -1145,13 +2211,7 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                 error_lower = error_str.lower()
                 
                 # Check for missing system library errors
-                missing_lib_indicators = [
-                    "cannot open shared object file",
-                    "libnspr4.so",
-                    "shared libraries",
-                    "no such file or directory"
-                ]
-                is_missing_lib = any(indicator in error_lower for indicator in missing_lib_indicators)
+                is_missing_lib = bool(_MISSING_LIB_RE.search(error_lower))
                 
                 if is_missing_lib:
                     if is_streamlit_cloud():
@@ -1182,40 +2242,17 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
             
             # Check if we have a saved 2FA state (from previous 2FA attempt)
             # This happens when user is retrying with a 2FA code
-            temp_2fa_state_path = get_storage_state_path(username).replace('.json', '_2fa.json')
-            has_2fa_state = os.path.exists(temp_2fa_state_path) if two_factor_code else False
+            # (path computed once here and reused below; only stat it when retrying)
+            temp_2fa_state_path = get_2fa_state_path(username)
+            has_2fa_state = bool(two_factor_code) and os.path.exists(temp_2fa_state_path)
             
             # Try to load saved browser state first (normal session, not 2FA)
-            saved_state_path = load_browser_state(username)
+            saved_state = load_browser_state_dict(username)
             session_valid = False
             needs_login = True
             
-            # Base context options
-            context_options = {
-                # Use a realistic user agent (Chrome on Windows)
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                # Set realistic viewport size (common desktop resolution)
-                'viewport': {'width': 1920, 'height': 1080},
-                # Set locale and timezone (US-based defaults)
-                'locale': 'en-US',
-                'timezone_id': 'America/New_York',
-                # Set color scheme preference
-                'color_scheme': 'light',
-                # Grant common permissions to appear more like a real browser
-                'permissions': ['geolocation'],
-                # Set extra HTTP headers that real browsers send
-                'extra_http_headers': {
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Cache-Control': 'max-age=0',
-                }
-            }
+            # Base context options (shared module-level defaults, layered per context)
+            context_options = {**CONTEXT_OPTIONS}
             
             # If we have a saved 2FA state, use it (this means we're retrying with a code)
             if has_2fa_state:
@@ -1223,62 +2260,44 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                 if progress_callback:
                     progress_callback(0, len(image_paths), "Restoring 2FA session...", "info")
             # Otherwise, if we have a saved state, try to use it
-            elif saved_state_path:
-                context_options['storage_state'] = saved_state_path
+            elif saved_state:
+                context_options['storage_state'] = saved_state
                 if progress_callback:
                     progress_callback(0, len(image_paths), "Loading saved session...", "info")
             
             # Create browser context with saved state (if available)
             context = browser.new_context(**context_options)
             
-            page = context.new_page()
-            
-            # Inject JavaScript to hide automation indicators
+            # Hide automation indicators on every page of this context
             # This helps avoid detection by anti-bot systems
-            page.add_init_script("""
-                // Override webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Override plugins to appear more realistic
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                // Override languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Chrome runtime override
-                window.chrome = {
-                    runtime: {}
-                };
-            """)
+            context.add_init_script(STEALTH_SCRIPT)
+            
+            # Skip images, fonts and analytics; only the DOM is needed
+            context.route("**/*", _block_heavy_resources)
+            _apply_default_timeouts(context)
+            
+            page = context.new_page()
             
             try:
                 # If we have a saved state, validate it first
-                if saved_state_path:
+                if saved_state:
                     if progress_callback:
                         progress_callback(0, len(image_paths), "Validating saved session...", "info")
                     session_valid = validate_session(page)
                     
+                    if session_valid:
+                        # Loading the Image Library confirms the session: a
+                        # login redirect raises, so no separate probe navigation
+                        try:
+                            navigate_to_image_library(page)
+                        except Exception:
+                            session_valid = False
+                    
                     if session_valid:
                         # Session is valid, skip login
                         needs_login = False
                         if progress_callback:
                             progress_callback(0, len(image_paths), "Using saved session (no login needed)...", "info")
-                        # Navigate to Image Library
-                        navigate_to_image_library(page)
                     else:
                         # Session expired, clear it and login
                         if progress_callback:
@@ -1294,17 +2313,21 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                             progress_callback(0, len(image_paths), "Restoring 2FA session...", "info")
                         # Navigate to login URL - the saved state contains cookies that should
                         # keep us authenticated to the 2FA page
-                        page.goto(LOGIN_URL, timeout=30000)
-                        page.wait_for_load_state("networkidle")
-                        page.wait_for_timeout(2000)
+                        page.goto(LOGIN_URL, wait_until="domcontentloaded")
+                        try:
+                            # Either the 2FA code input or the login form, whichever renders
+                            page.wait_for_selector(
+                                f'{TWO_FACTOR_SELECTOR}, input[type="password"]',
+                                state='attached'
+                            )
+                        except:
+                            pass
                         
-                        # Check if we're on the 2FA page
-                        page_content = page.content().lower()
-                        two_factor_indicators = [
-                            'two-factor', '2fa', 'verification code', 'authenticator',
-                            'security code', 'enter code', 'verify your identity'
-                        ]
-                        is_on_2fa_page = any(indicator in page_content for indicator in two_factor_indicators)
+                        # Check if we're on the 2FA page: probe for the code input in
+                        # the browser first, only pull the full DOM if nothing matches
+                        is_on_2fa_page = page.locator(TWO_FACTOR_SELECTOR).count() > 0
+                        if not is_on_2fa_page:
+                            is_on_2fa_page = bool(TWO_FACTOR_TEXT_RE.search(page.content()))
                         
                         if is_on_2fa_page:
                             # We're on the 2FA page, submit the code directly
@@ -1332,27 +2355,24 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                         
                         # Save browser state to a temporary file for 2FA retry
                         # Use a special 2FA state file that will be loaded on retry
-                        temp_2fa_state_path = get_storage_state_path(username).replace('.json', '_2fa.json')
+                        saved_2fa_state_path = temp_2fa_state_path
                         try:
-                            context.storage_state(path=temp_2fa_state_path)
-                            os.chmod(temp_2fa_state_path, 0o600)
+                            _write_state_file(saved_2fa_state_path, context.storage_state())
                         except Exception as e:
                             # If we can't save state, still raise exception but without state
-                            temp_2fa_state_path = None
+                            saved_2fa_state_path = None
                         
                         # Raise exception with context information
                         raise TwoFactorAuthRequired(
                             "Two-factor authentication is required. Please enter your 6-digit code.",
                             current_url=current_url,
-                            browser_state_path=temp_2fa_state_path
+                            browser_state_path=saved_2fa_state_path
                         )
                     
                     if not login_success:
                         # Login failed
                         error_msg = login_error or "Login failed. Please check your credentials and try again."
-                        for image_path in image_paths:
-                            filename = os.path.basename(image_path)
-                            failed.append((filename, error_msg))
+                        failed.extend((filename, error_msg) for filename in filenames)
                         return {
                             'successful': successful,
                             'failed': failed,
@@ -1365,10 +2385,10 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                     save_browser_state(context, username)
                     
                     # Clean up 2FA state file if it exists (login successful)
-                    if has_2fa_state and os.path.exists(temp_2fa_state_path):
+                    if has_2fa_state:
                         try:
                             os.remove(temp_2fa_state_path)
-                        except:
+                        except OSError:
                             pass
                     
                     # Navigate to Image Library
@@ -1376,25 +2396,47 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                         progress_callback(0, len(image_paths), "Navigating to Image Library...", "info")
                     navigate_to_image_library(page)
                 
-                # Upload each image
-                for i, image_path in enumerate(image_paths, 1):
-                    filename = os.path.basename(image_path)
-                    
-                    if progress_callback:
-                        progress_callback(i, len(image_paths), filename, "uploading")
-                    
-                    success, uploaded_filename, error, url = upload_image(page, image_path, verify=True)
-                    
-                    if success and url:
-                        successful.append(uploaded_filename)
-                        urls.append(url)
-                        if progress_callback:
-                            progress_callback(i, len(image_paths), filename, "success")
+                # One keep-alive HTTP session for every verification HEAD in this batch
+                http_session = _create_http_session()
+                try:
+                    if len(image_paths) > 1:
+                        # Upload from several pages of one async browser that reuse
+                        # this session's cookies, so uploads overlap instead of queueing
+                        batch_successful, batch_failed, batch_urls = _upload_images_parallel(
+                            context.storage_state(),
+                            image_paths,
+                            progress_callback,
+                            http_session=http_session,
+                            max_concurrency=concurrency or MAX_UPLOAD_WORKERS,
+                            user_key=username
+                        )
+                        successful.extend(batch_successful)
+                        failed.extend(batch_failed)
+                        urls.extend(batch_urls)
                     else:
-                        error_msg = error or "Upload verification failed"
-                        failed.append((filename, error_msg))
-                        if progress_callback:
-                            progress_callback(i, len(image_paths), filename, "error")
+                        # Upload each image
+                        for i, image_path in enumerate(image_paths, 1):
+                            filename = _image_name(image_path)
+                        
+                            if progress_callback:
+                                progress_callback(i, len(image_paths), filename, "uploading")
+                        
+                            success, uploaded_filename, error, url = upload_image(
+                                page, image_path, verify=True, session=http_session
+                            )
+                        
+                            if success and url:
+                                successful.append(uploaded_filename)
+                                urls.append(url)
+                                if progress_callback:
+                                    progress_callback(i, len(image_paths), filename, "success")
+                            else:
+                                error_msg = error or "Upload verification failed"
+                                failed.append((filename, error_msg))
+                                if progress_callback:
+                                    progress_callback(i, len(image_paths), filename, "error")
+                finally:
+                    http_session.close()
             
             except TwoFactorAuthRequired:
                 # Re-raise 2FA exception so it can be handled by the caller
@@ -1402,36 +2444,26 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
                 raise
             except Exception as e:
                 # If login or navigation fails, mark all as failed
-                for image_path in image_paths:
-                    filename = os.path.basename(image_path)
-                    failed.append((filename, f"Initialization error: {str(e)}"))
+                failed.extend((filename, f"Initialization error: {str(e)}") for filename in filenames)
             finally:
                 # Safely close browser if it was created
-                try:
-                    if 'browser' in locals() and browser:
+                if browser is not None:
+                    try:
                         browser.close()
-                except:
-                    pass  # Browser may not have been created or already closed
+                    except:
+                        pass  # Browser may already be closed
     
     except RuntimeError as e:
         # Catch our custom RuntimeError for missing browsers
         error_msg = str(e)
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
     except Exception as e:
         # Catch any other unexpected errors during browser launch
         error_msg = f"Browser launch error: {str(e)}"
         error_lower = str(e).lower()
         
-        # Check for system library errors
-        missing_lib_indicators = [
-            "cannot open shared object file",
-            "libnspr4.so",
-            "shared libraries",
-            "no such file or directory"
-        ]
-        is_missing_lib = any(indicator in error_lower for indicator in missing_lib_indicators)
+        # Check for missing system library errors
+        is_missing_lib = bool(_MISSING_LIB_RE.search(error_lower))
         
         if is_missing_lib:
             if is_streamlit_cloud():
@@ -1449,9 +2481,7 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
         elif "executable doesn't exist" in error_lower:
             error_msg += "\nPlease run: python -m playwright install chromium"
         
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
     
     return {
         'successful': successful,
@@ -1460,7 +2490,7 @@ def upload_images_batch(username, password, image_paths, progress_callback=None,
     }
 
 
-def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
+def upload_images_with_cookies(cookies, image_paths, progress_callback=None, concurrency=None):
     """
     Upload images using pre-authenticated cookies (bypasses 2FA).
     
@@ -1471,8 +2501,10 @@ def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
     Args:
         cookies: List of cookie dicts or Playwright storage state dict
                  Each cookie should have: name, value, domain, path
-        image_paths: List of paths to image files
+        image_paths: List of paths to image files, or in-memory payload dicts
+            ({'name', 'mimeType', 'buffer'}) so callers can skip writing temp files
         progress_callback: Optional callback function(current, total, filename, status)
+        concurrency: Optional number of simultaneous uploads (default MAX_UPLOAD_WORKERS)
         
     Returns:
         dict: {
@@ -1484,20 +2516,24 @@ def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
     successful = []
     failed = []
     urls = []
+    progress_callback = _throttle_progress(progress_callback)
+    
+    # Reject oversized files before paying for browser startup
+    image_paths, failed = _filter_valid_sizes(image_paths)
+    if not image_paths:
+        return {'successful': successful, 'failed': failed, 'urls': urls}
+    # Basenames for the error paths that fail the whole batch at once
+    filenames = [_image_name(p) for p in image_paths]
     
     # Ensure Playwright browsers are installed
     try:
         if not ensure_playwright_browsers_installed(progress_callback):
             error_msg = "Playwright browsers are not installed."
-            for image_path in image_paths:
-                filename = os.path.basename(image_path)
-                failed.append((filename, error_msg))
+            failed.extend((filename, error_msg) for filename in filenames)
             return {'successful': successful, 'failed': failed, 'urls': urls}
     except Exception as e:
         error_msg = f"Playwright setup error: {str(e)}"
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
         return {'successful': successful, 'failed': failed, 'urls': urls}
     
     # Import Playwright
@@ -1505,9 +2541,7 @@ def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
         sync_playwright, _, PlaywrightError = _import_playwright()
     except (ImportError, RuntimeError) as e:
         error_msg = f"Cannot use browser automation: {str(e)}"
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        failed.extend((filename, error_msg) for filename in filenames)
         return {'successful': successful, 'failed': failed, 'urls': urls}
     
     # Normalize cookies to Playwright storage state format
@@ -1516,10 +2550,8 @@ def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
     elif isinstance(cookies, dict) and 'cookies' in cookies:
         storage_state = cookies
     else:
-        error_msg = "Invalid cookie format"
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            failed.append((filename, error_msg))
+        error_msg = INVALID_COOKIES_MESSAGE
+        failed.extend((filename, error_msg) for filename in filenames)
         return {'successful': successful, 'failed': failed, 'urls': urls}
     
     try:
@@ -1529,107 +2561,135 @@ def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
             
             browser = p.chromium.launch(headless=True)
             
-            # Context options with realistic browser fingerprint
-            context_options = {
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'viewport': {'width': 1920, 'height': 1080},
-                'locale': 'en-US',
-                'timezone_id': 'America/New_York',
-                'color_scheme': 'light',
-                'extra_http_headers': {
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                }
-            }
-            
-            # Create context with cookies
-            context = browser.new_context(**context_options, storage_state=storage_state)
-            page = context.new_page()
+            # Create context with cookies (shared module-level defaults, layered per context)
+            context_options = {**CONTEXT_OPTIONS, 'storage_state': storage_state}
+            context = browser.new_context(**context_options)
             
             # Inject anti-detection script
-            page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-                Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-                window.chrome = { runtime: {} };
-            """)
+            context.add_init_script(STEALTH_SCRIPT)
+            
+            # Skip images, fonts and analytics; only the DOM is needed
+            context.route("**/*", _block_heavy_resources)
+            _apply_default_timeouts(context)
+            
+            page = context.new_page()
             
             try:
                 # Navigate directly to Image Library (cookies should authenticate us)
                 if progress_callback:
                     progress_callback(0, len(image_paths), "Verifying session...", "info")
                 
-                page.goto(IMAGE_LIBRARY_URL, timeout=30000)
-                page.wait_for_load_state("networkidle")
+                page.goto(IMAGE_LIBRARY_URL, wait_until="domcontentloaded")
+                
+                # Return as soon as the page shows which state we're in (Upload
+                # Image link, login form or 2FA prompt) instead of waiting for
+                # background requests to go idle
+                try:
+                    page.get_by_role("link", name="Upload Image").or_(
+                        page.locator('input[type="password"]')
+                    ).or_(
+                        page.locator(TWO_FACTOR_SELECTOR)
+                    ).first.wait_for(state='attached')
+                except:
+                    pass  # Fall through to the checks below
                 
                 # Check if we're authenticated
                 current_url = page.url
                 if 'AdminLogin' in current_url or 'login' in current_url.lower():
                     # Cookies didn't work - session might be expired
-                    error_msg = (
-                        "Session cookies are invalid or expired. "
-                        "Please log into Luminate in your browser again and export fresh cookies."
-                    )
-                    for image_path in image_paths:
-                        filename = os.path.basename(image_path)
-                        failed.append((filename, error_msg))
+                    error_msg = SESSION_EXPIRED_MESSAGE
+                    failed.extend((filename, error_msg) for filename in filenames)
                     return {'successful': successful, 'failed': failed, 'urls': urls}
                 
                 # Check for 2FA prompt (shouldn't happen with valid cookies, but just in case)
-                page_content = page.content().lower()
-                two_factor_indicators = ['two-factor', '2fa', 'verification code', 'authenticator']
-                if any(indicator in page_content for indicator in two_factor_indicators):
-                    error_msg = (
-                        "2FA is still being requested. Your session cookies may not include the 2FA completion. "
-                        "Please complete 2FA in your browser and export cookies again."
-                    )
-                    for image_path in image_paths:
-                        filename = os.path.basename(image_path)
-                        failed.append((filename, error_msg))
+                if page.locator(TWO_FACTOR_SELECTOR).count() > 0:
+                    error_msg = SESSION_2FA_PENDING_MESSAGE
+                    failed.extend((filename, error_msg) for filename in filenames)
                     return {'successful': successful, 'failed': failed, 'urls': urls}
                 
                 # Verify we can see the Upload button
                 try:
-                    page.wait_for_selector('text=Upload Image', timeout=10000)
+                    page.get_by_role("link", name="Upload Image").wait_for(state='visible')
                 except:
-                    error_msg = "Could not access Image Library. Session may be invalid."
-                    for image_path in image_paths:
-                        filename = os.path.basename(image_path)
-                        failed.append((filename, error_msg))
+                    error_msg = SESSION_NO_LIBRARY_MESSAGE
+                    failed.extend((filename, error_msg) for filename in filenames)
                     return {'successful': successful, 'failed': failed, 'urls': urls}
                 
                 if progress_callback:
                     progress_callback(0, len(image_paths), "Session valid! Starting uploads...", "info")
                 
-                # Upload each image
-                for i, image_path in enumerate(image_paths, 1):
-                    filename = os.path.basename(image_path)
-                    
-                    if progress_callback:
-                        progress_callback(i, len(image_paths), filename, "uploading")
+                # One keep-alive HTTP session for every verification HEAD in this batch
+                http_session = _create_http_session()
+                try:
+                    # Progress runs over the whole batch, so the browser path
+                    # continues counting after the files the fast path handled
+                    total = len(image_paths)
+                    done = 0
                     
-                    success, uploaded_filename, error, url = upload_image(page, image_path, verify=True)
+                    # Fast path: plain multipart POSTs with the session cookies;
+                    # only files it could not send go through the browser
+                    form_spec = _discover_upload_form(page) if DIRECT_UPLOAD_ENABLED else None
+                    if form_spec:
+                        direct_successful, direct_failed, direct_urls, image_paths = _upload_images_direct(
+                            context.storage_state(),
+                            form_spec,
+                            image_paths,
+                            progress_callback,
+                            http_session=http_session,
+                            max_workers=concurrency or MAX_UPLOAD_WORKERS
+                        )
+                        successful.extend(direct_successful)
+                        failed.extend(direct_failed)
+                        urls.extend(direct_urls)
+                        done = total - len(image_paths)
                     
-                    if success and url:
-                        successful.append(uploaded_filename)
-                        urls.append(url)
-                        if progress_callback:
-                            progress_callback(i, len(image_paths), filename, "success")
+                    if len(image_paths) > 1:
+                        # Same bounded concurrent upload path as upload_images_batch()
+                        batch_successful, batch_failed, batch_urls = _upload_images_parallel(
+                            context.storage_state(),
+                            image_paths,
+                            progress_callback,
+                            http_session=http_session,
+                            max_concurrency=concurrency or MAX_UPLOAD_WORKERS,
+                            progress_offset=done,
+                            progress_total=total
+                        )
+                        successful.extend(batch_successful)
+                        failed.extend(batch_failed)
+                        urls.extend(batch_urls)
                     else:
-                        error_msg = error or "Upload verification failed"
-                        failed.append((filename, error_msg))
-                        if progress_callback:
-                            progress_callback(i, len(image_paths), filename, "error")
+                        # Upload each image
+                        for i, image_path in enumerate(image_paths, done + 1):
+                            filename = _image_name(image_path)
+                            
+                            if progress_callback:
+                                progress_callback(i, total, filename, "uploading")
+                            
+                            success, uploaded_filename, error, url = upload_image(
+                                page, image_path, verify=True, session=http_session
+                            )
+                            
+                            if success and url:
+                                successful.append(uploaded_filename)
+                                urls.append(url)
+                                if progress_callback:
+                                    progress_callback(i, total, filename, "success")
+                            else:
+                                error_msg = error or "Upload verification failed"
+                                failed.append((filename, error_msg))
+                                if progress_callback:
+                                    progress_callback(i, total, filename, "error")
+                finally:
+                    http_session.close()
                 
             finally:
                 browser.close()
                 
     except Exception as e:
         error_msg = f"Upload error: {str(e)}"
-        for image_path in image_paths:
-            filename = os.path.basename(image_path)
-            if not any(f[0] == filename for f in failed):  # Avoid duplicates
-                failed.append((filename, error_msg))
+        # Avoid duplicates, and keep files the fast path already uploaded
+        already_done = {f[0] for f in failed}.union(successful)
+        failed.extend((filename, error_msg) for filename in filenames if filename not in already_done)
     
     return {
         'successful': successful,
@@ -1638,6 +2698,17 @@ def upload_images_with_cookies(cookies, image_paths, progress_callback=None):
     }
 
 
+def _batch_concurrency(count):
+    """Pick the number of simultaneous uploads for a batch of count files.
+    
+    Small batches use MAX_UPLOAD_WORKERS; larger ones scale up by one page
+    per four files, capped at MAX_UPLOAD_CONCURRENCY.
+    """
+    if count <= 8:
+        return MAX_UPLOAD_WORKERS
+    return min(count // 4 + 1, MAX_UPLOAD_CONCURRENCY)
+
+
 def upload_images_auto(
     image_paths, 
     username=None, 
@@ -1650,10 +2721,12 @@ def upload_images_auto(
     
     Priority:
     1. If cookies provided and valid -> use cookie-based auth (no 2FA)
-    2. If username/password provided -> use login-based auth (may trigger 2FA)
+    2. If username/password provided -> use login-based auth (may trigger 2FA),
+       also when the cookie session is rejected before anything uploads
     
     Args:
-        image_paths: List of paths to image files
+        image_paths: List of paths to image files, or in-memory payload dicts
+            ({'name', 'mimeType', 'buffer'}) so callers can skip writing temp files
         username: Optional Luminate username
         password: Optional Luminate password  
         cookies: Optional pre-authenticated cookies (recommended to avoid 2FA)
@@ -1667,21 +2740,36 @@ def upload_images_auto(
             'auth_method': 'cookies' or 'login'
         }
     """
+    if not image_paths:
+        return {'successful': [], 'failed': [], 'urls': [], 'auth_method': None}
+    
+    # Single files take the sequential path inside each uploader; larger
+    # batches get more upload pages
+    concurrency = _batch_concurrency(len(image_paths))
+    
     # Try cookies first (preferred - no 2FA)
     if cookies:
         if progress_callback:
             progress_callback(0, len(image_paths), "Using session cookies (no login needed)...", "info")
         
-        result = upload_images_with_cookies(cookies, image_paths, progress_callback)
+        result = upload_images_with_cookies(cookies, image_paths, progress_callback, concurrency=concurrency)
         result['auth_method'] = 'cookies'
-        return result
+        # Only the session-rejection messages mean the cookies themselves were the
+        # problem; per-file errors never trigger a password login
+        cookie_failed = not result['successful'] and any(
+            error in SESSION_REJECTED_MESSAGES for _, error in result['failed']
+        )
+        if not (cookie_failed and username and password):
+            return result
+        if progress_callback:
+            progress_callback(0, len(image_paths), "Session cookies were rejected, logging in instead...", "info")
     
     # Fall back to login
     if username and password:
         if progress_callback:
             progress_callback(0, len(image_paths), "Logging in (may require 2FA)...", "info")
         
-        result = upload_images_batch(username, password, image_paths, progress_callback)
+        result = upload_images_batch(username, password, image_paths, progress_callback, concurrency=concurrency)
         result['auth_method'] = 'login'
         return result
     
@@ -1689,7 +2777,7 @@ def upload_images_auto(
     error_msg = "No authentication provided. Please provide either cookies or username/password."
     return {
         'successful': [],
-        'failed': [(os.path.basename(p), error_msg) for p in image_paths],
+        'failed': [(_image_name(p), error_msg) for p in image_paths],
         'urls': [],
         'auth_method': None
     }
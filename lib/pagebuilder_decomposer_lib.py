@@ -8,6 +8,7 @@ for Streamlit download operations.
 """
 
 import re
+import json
 import requests
 import os
 from typing import Dict, List, Set, Optional, Callable, Tuple
@@ -23,7 +24,6 @@ def _safe_debug_log(data: dict):
         # Create directory if it doesn't exist
         os.makedirs(debug_log_dir, exist_ok=True)
         # Write to log file
-        import json
         with open(debug_log_path, 'a') as f:
             f.write(json.dumps(data) + '\n')
     except Exception:
@@ -10,10 +10,28 @@ This solves the problem of ephemeral /tmp storage in Cloud Run containers.
 """
 
 import os
+import io
+import gzip
 import json
 import hashlib
+import functools
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, TypeVar
+
+try:
+    from google.api_core import exceptions as gcs_exceptions
+    RETRYABLE_GCS_ERRORS = (gcs_exceptions.ServerError, gcs_exceptions.TooManyRequests, ConnectionError)
+except ImportError:
+    RETRYABLE_GCS_ERRORS = (ConnectionError,)
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+T = TypeVar('T')
 
 # Check if running on Google Cloud
 def is_google_cloud():
@@ -40,6 +58,67 @@ def get_gcs_bucket_name():
     return None
 
 
+# Leading bytes of a gzip stream; sessions saved before compression are plain JSON
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _dumps_session(data: Dict[str, Any]) -> bytes:
+    """Serialize session data to compact JSON bytes (orjson when available)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_session(content: bytes) -> Dict[str, Any]:
+    """Parse session JSON bytes (raises json.JSONDecodeError on bad input)."""
+    if _HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _gzip_json(data: Dict[str, Any]) -> io.BytesIO:
+    """Encode data as gzip-compressed JSON into a rewound in-memory buffer."""
+    # compresslevel=3: most of the size win on JSON at a fraction of level 9's CPU
+    if _HAS_ORJSON:
+        # orjson builds the bytes in one native pass, faster than streaming
+        return io.BytesIO(gzip.compress(orjson.dumps(data), compresslevel=3))
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=3) as gz:
+        for chunk in json.JSONEncoder().iterencode(data):
+            gz.write(chunk.encode())
+    buf.seek(0)
+    return buf
+
+
+def _decode_session_bytes(content: bytes) -> Dict[str, Any]:
+    """Decode a stored session, accepting gzip-compressed or plain JSON."""
+    if content[:2] == GZIP_MAGIC:
+        content = gzip.decompress(content)
+    return _loads_session(content)
+
+
+def _retry(fn: Callable[[], T], attempts: int = 3) -> T:
+    """Call fn, retrying transient GCS errors with 1s, 2s, ... backoff.
+    
+    Only wrap idempotent operations: a retried call may repeat work the
+    failed attempt already completed server-side.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except RETRYABLE_GCS_ERRORS:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+@functools.lru_cache(maxsize=256)
+def _session_key(username: str) -> tuple:
+    """Hash a username once into (session file key, short hash for metadata)."""
+    digest = hashlib.sha256(username.encode()).hexdigest()
+    return f"session_{digest[:16]}.json", digest[:8]
+
+
 class SessionStorage:
     """
     Persistent session storage that works across Cloud Run instances.
@@ -103,8 +182,20 @@ class SessionStorage:
     
     def _get_session_key(self, username: str) -> str:
         """Generate a secure key for the session file."""
-        username_hash = hashlib.sha256(username.encode()).hexdigest()[:16]
-        return f"session_{username_hash}.json"
+        return _session_key(username)[0]
+    
+    def _local_session_paths(self, key: str) -> tuple:
+        """
+        Local file paths for a session key.
+        
+        Files are sharded into subdirectories named after the first two hash
+        characters so no single directory grows with the user count.
+        
+        Returns:
+            tuple: (sharded path, legacy flat path from before sharding)
+        """
+        shard = key[len("session_"):][:2]
+        return os.path.join(self.local_dir, shard, key), os.path.join(self.local_dir, key)
     
     def save_session(self, username: str, session_data: Dict[str, Any]) -> bool:
         """
@@ -117,26 +208,36 @@ class SessionStorage:
         Returns:
             bool: True if saved successfully
         """
-        key = self._get_session_key(username)
+        key, username_hash = _session_key(username)
         
         # Add metadata
         session_data['_saved_at'] = time.time()
-        session_data['_username_hash'] = hashlib.sha256(username.encode()).hexdigest()[:8]
+        session_data['_username_hash'] = username_hash
         
         try:
             if self.use_gcs and self._bucket:
                 blob = self._bucket.blob(f"sessions/{key}")
-                blob.upload_from_string(
-                    json.dumps(session_data),
-                    content_type='application/json'
-                )
+                blob.content_encoding = 'gzip'
+                # Re-encode per attempt so a retry never resends a half-read buffer;
+                # overwriting with the same bytes makes the upload safe to repeat
+                _retry(lambda: blob.upload_from_file(
+                    _gzip_json(session_data),
+                    content_type='application/json',
+                    rewind=False
+                ))
                 return True
             else:
                 # Local storage
-                path = os.path.join(self.local_dir, key)
-                with open(path, 'w') as f:
-                    json.dump(session_data, f)
+                path, legacy_path = self._local_session_paths(key)
+                os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(_dumps_session(session_data))
                 os.chmod(path, 0o600)
+                # Drop any pre-sharding copy so it can't be loaded instead
+                try:
+                    os.remove(legacy_path)
+                except FileNotFoundError:
+                    pass
                 return True
         except Exception as e:
             print(f"Warning: Failed to save session: {e}")
@@ -158,17 +259,19 @@ class SessionStorage:
         try:
             if self.use_gcs and self._bucket:
                 blob = self._bucket.blob(f"sessions/{key}")
-                if not blob.exists():
+                if not _retry(blob.exists):
                     return None
-                content = blob.download_as_string()
-                session_data = json.loads(content)
+                content = _retry(blob.download_as_string)
+                session_data = _decode_session_bytes(content)
             else:
-                # Local storage
-                path = os.path.join(self.local_dir, key)
+                # Local storage (falls back to the pre-sharding flat path)
+                path, legacy_path = self._local_session_paths(key)
                 if not os.path.exists(path):
-                    return None
-                with open(path, 'r') as f:
-                    session_data = json.load(f)
+                    path = legacy_path
+                    if not os.path.exists(path):
+                        return None
+                with open(path, 'rb') as f:
+                    session_data = _loads_session(f.read())
             
             # Check age
             saved_at = session_data.get('_saved_at', 0)
@@ -198,30 +301,83 @@ class SessionStorage:
         try:
             if self.use_gcs and self._bucket:
                 blob = self._bucket.blob(f"sessions/{key}")
-                if blob.exists():
-                    blob.delete()
+                if _retry(blob.exists):
+                    _retry(blob.delete)
                 return True
             else:
-                # Local storage
-                path = os.path.join(self.local_dir, key)
-                if os.path.exists(path):
-                    os.remove(path)
+                # Local storage (sharded and pre-sharding paths)
+                for path in self._local_session_paths(key):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
                 return True
         except Exception as e:
             print(f"Warning: Failed to delete session: {e}")
             return False
     
-    def has_session(self, username: str) -> bool:
-        """Check if a valid session exists for the user."""
-        return self.load_session(username) is not None
+    def has_session(self, username: str, max_age_hours: int = 24) -> bool:
+        """
+        Check if a valid session exists for the user.
+        
+        Uses object/file metadata only (no download or JSON parse); the
+        session's age is taken from its last write time.
+        
+        Args:
+            username: Username to check
+            max_age_hours: Maximum age of session in hours (default 24)
+            
+        Returns:
+            bool: True if a session exists and is not older than max_age_hours
+        """
+        key = self._get_session_key(username)
+        
+        try:
+            if self.use_gcs and self._bucket:
+                # get_blob() is a single metadata request; None if missing
+                blob = _retry(lambda: self._bucket.get_blob(f"sessions/{key}"))
+                if blob is None or blob.updated is None:
+                    return False
+                saved_at = blob.updated.timestamp()
+            else:
+                # Local storage (falls back to the pre-sharding flat path)
+                path, legacy_path = self._local_session_paths(key)
+                try:
+                    saved_at = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    try:
+                        saved_at = os.stat(legacy_path).st_mtime
+                    except FileNotFoundError:
+                        return False
+            
+            age_hours = (time.time() - saved_at) / 3600
+            return age_hours <= max_age_hours
+            
+        except Exception as e:
+            print(f"Warning: Failed to check session: {e}")
+            return False
 
 
 # Global session storage instance
 _session_storage = None
+_session_storage_lock = threading.Lock()
 
 def get_session_storage() -> SessionStorage:
-    """Get the global session storage instance."""
+    """Get the global session storage instance.
+    
+    Construction is serialized, so a caller arriving while the background
+    prewarm is still connecting waits for that client instead of building
+    a second one.
+    """
     global _session_storage
     if _session_storage is None:
-        _session_storage = SessionStorage()
+        with _session_storage_lock:
+            if _session_storage is None:
+                _session_storage = SessionStorage()
     return _session_storage
+
+
+# On Google Cloud, create the GCS client and fetch the bucket in the background
+# at import so the first save/load doesn't pay for it
+if is_google_cloud():
+    threading.Thread(target=get_session_storage, name="session-storage-prewarm", daemon=True).start()
@@ -0,0 +1,116 @@
+"""
+Tests for the cookie helper parsers.
+
+Covers the name=value paste parser, the bookmarklet export decoder and
+the conversion to a Playwright storage state.
+"""
+
+import base64
+import json
+import time
+import unittest
+from unittest import mock
+
+
+class TestParseSimpleCookiePaste(unittest.TestCase):
+    """Pasted name=value lines become Luminate cookie dicts."""
+
+    def test_parses_pairs_and_skips_comments_and_junk(self):
+        """Comments, blank lines and lines without '=' are ignored."""
+        from lib.cookie_helper import parse_simple_cookie_paste
+
+        cookies = parse_simple_cookie_paste(
+            "# exported cookies\n"
+            "  JSESSIONID = abc123 \n"
+            "\n"
+            "not a cookie\n"
+            "token=a=b\n"
+        )
+
+        self.assertEqual([c["name"] for c in cookies], ["JSESSIONID", "token"])
+        self.assertEqual(cookies[0]["value"], "abc123")
+        # Only the first '=' splits, so values may contain '='
+        self.assertEqual(cookies[1]["value"], "a=b")
+        for cookie in cookies:
+            self.assertEqual(cookie["domain"], "secure2.convio.net")
+            self.assertEqual(cookie["path"], "/")
+            self.assertTrue(cookie["secure"])
+
+    def test_returns_none_without_cookies(self):
+        """Text with no name=value pairs is not a cookie paste."""
+        from lib.cookie_helper import parse_simple_cookie_paste
+
+        self.assertIsNone(parse_simple_cookie_paste("# nothing here\n\n=value\n"))
+
+    def test_expiry_is_computed_per_call(self):
+        """Pasting the same text later yields a fresh expiry, never a stale one."""
+        from lib.cookie_helper import parse_simple_cookie_paste
+
+        with mock.patch("lib.cookie_helper.time.time", return_value=1000.0):
+            first = parse_simple_cookie_paste("a=1\nb=2")
+        with mock.patch("lib.cookie_helper.time.time", return_value=1000.0 + 25 * 3600):
+            second = parse_simple_cookie_paste("a=1\nb=2")
+
+        self.assertEqual({c["expires"] for c in first}, {1000.0 + 86400})
+        self.assertEqual({c["expires"] for c in second}, {1000.0 + 25 * 3600 + 86400})
+
+    def test_cookies_do_not_share_state(self):
+        """Each cookie is its own dict, so editing one leaves the others alone."""
+        from lib.cookie_helper import parse_simple_cookie_paste
+
+        cookies = parse_simple_cookie_paste("a=1\nb=2")
+        cookies[0]["domain"] = "example.com"
+
+        self.assertEqual(cookies[1]["domain"], "secure2.convio.net")
+
+
+class TestParseCookieExport(unittest.TestCase):
+    """Base64 bookmarklet exports are decoded and age-checked."""
+
+    def _encode(self, data):
+        return base64.b64encode(json.dumps(data).encode("utf-8")).decode("ascii")
+
+    def test_decodes_recent_export(self):
+        """A fresh export round-trips to its cookie list."""
+        from lib.cookie_helper import parse_cookie_export
+
+        data = {"cookies": [{"name": "a", "value": "1"}], "timestamp": time.time() * 1000}
+
+        self.assertEqual(parse_cookie_export(self._encode(data))["cookies"], data["cookies"])
+
+    def test_rejects_stale_or_malformed_exports(self):
+        """Exports older than 48 hours, without a cookie list, or not base64 are rejected."""
+        from lib.cookie_helper import parse_cookie_export
+
+        stale = {"cookies": [], "timestamp": (time.time() - 49 * 3600) * 1000}
+
+        self.assertIsNone(parse_cookie_export(self._encode(stale)))
+        self.assertIsNone(parse_cookie_export(self._encode({"cookies": "nope"})))
+        self.assertIsNone(parse_cookie_export("%%% not base64 %%%"))
+
+
+class TestCookiesToPlaywrightState(unittest.TestCase):
+    """Exported cookies are filled in with Playwright defaults."""
+
+    def test_fills_missing_fields(self):
+        """Missing fields take the Luminate defaults; present fields are kept."""
+        from lib.cookie_helper import cookies_to_playwright_state
+
+        state = cookies_to_playwright_state({
+            "cookies": [
+                {"name": "a", "value": "1"},
+                {"name": "b", "value": "2", "path": "/admin", "expires": 42},
+            ]
+        })
+
+        self.assertEqual(state["origins"], [])
+        first, second = state["cookies"]
+        self.assertEqual(first["domain"], "secure2.convio.net")
+        self.assertEqual(first["sameSite"], "Lax")
+        self.assertGreater(first["expires"], time.time())
+        self.assertEqual(second["path"], "/admin")
+        self.assertEqual(second["expires"], 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
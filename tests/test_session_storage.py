@@ -0,0 +1,104 @@
+"""
+Tests for local session storage.
+
+Covers the gzip/plain JSON codecs and the sharded local layout, including
+the fallback to sessions saved before sharding.
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+
+class TestSessionCodecs(unittest.TestCase):
+    """Stored sessions decode whether or not they were gzip-compressed."""
+
+    def test_gzip_round_trip(self):
+        """Gzip-encoded sessions decode back to the original data."""
+        from lib.session_storage import GZIP_MAGIC, _decode_session_bytes, _gzip_json
+
+        data = {"cookies": [{"name": "a", "value": "1"}], "_saved_at": 1.5}
+        content = _gzip_json(data).read()
+
+        self.assertEqual(content[:2], GZIP_MAGIC)
+        self.assertEqual(_decode_session_bytes(content), data)
+
+    def test_plain_json_still_loads(self):
+        """Sessions saved before compression are plain JSON and still load."""
+        from lib.session_storage import _decode_session_bytes
+
+        data = {"cookies": [], "origins": []}
+
+        self.assertEqual(_decode_session_bytes(json.dumps(data).encode("utf-8")), data)
+
+
+class TestLocalSessionStorage(unittest.TestCase):
+    """Local sessions are sharded by key and fall back to the flat layout."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.dict(os.environ, {"TMPDIR": self._tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        from lib.session_storage import SessionStorage
+        self.storage = SessionStorage(use_gcs=False)
+
+    def test_save_load_round_trip(self):
+        """A saved session loads back with its metadata in a shard directory."""
+        self.assertTrue(self.storage.save_session("user@example.org", {"cookies": [{"name": "a"}]}))
+
+        loaded = self.storage.load_session("user@example.org")
+
+        self.assertEqual(loaded["cookies"], [{"name": "a"}])
+        self.assertIn("_saved_at", loaded)
+        key = self.storage._get_session_key("user@example.org")
+        sharded, legacy = self.storage._local_session_paths(key)
+        self.assertTrue(os.path.exists(sharded))
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual(os.path.basename(os.path.dirname(sharded)), key[len("session_"):][:2])
+
+    def test_legacy_flat_file_is_loaded_then_replaced(self):
+        """A pre-sharding file is still read, and the next save removes it."""
+        key = self.storage._get_session_key("legacy")
+        sharded, legacy = self.storage._local_session_paths(key)
+        with open(legacy, "w") as f:
+            json.dump({"cookies": ["old"], "_saved_at": time.time()}, f)
+
+        self.assertEqual(self.storage.load_session("legacy")["cookies"], ["old"])
+
+        self.storage.save_session("legacy", {"cookies": ["new"]})
+
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual(self.storage.load_session("legacy")["cookies"], ["new"])
+
+    def test_expired_session_is_deleted(self):
+        """Sessions older than max_age_hours load as None and are removed."""
+        self.storage.save_session("old", {"cookies": []})
+        key = self.storage._get_session_key("old")
+        sharded, _ = self.storage._local_session_paths(key)
+        with open(sharded, "w") as f:
+            json.dump({"cookies": [], "_saved_at": time.time() - 25 * 3600}, f)
+
+        self.assertIsNone(self.storage.load_session("old", max_age_hours=24))
+        self.assertFalse(os.path.exists(sharded))
+
+    def test_delete_removes_both_layouts(self):
+        """Deleting clears the sharded file and any leftover flat copy."""
+        self.storage.save_session("both", {"cookies": []})
+        key = self.storage._get_session_key("both")
+        sharded, legacy = self.storage._local_session_paths(key)
+        with open(legacy, "w") as f:
+            f.write("{}")
+
+        self.assertTrue(self.storage.delete_session("both"))
+        self.assertFalse(os.path.exists(sharded))
+        self.assertFalse(os.path.exists(legacy))
+
+
+if __name__ == "__main__":
+    unittest.main()
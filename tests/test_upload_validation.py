@@ -0,0 +1,50 @@
+"""
+Tests for upload validation shared by the start endpoints.
+
+Checks file type and size rules without reading any file contents.
+"""
+
+import importlib.util
+import unittest
+from types import SimpleNamespace
+
+_HAS_FASTAPI = importlib.util.find_spec("fastapi") is not None
+
+
+def _upload(filename, size):
+    """Minimal stand-in for a Starlette UploadFile (only name and size are read)."""
+    return SimpleNamespace(filename=filename, size=size)
+
+
+@unittest.skipUnless(_HAS_FASTAPI, "fastapi is not installed")
+class TestValidateUploads(unittest.TestCase):
+    """Every file is checked by extension and spooled size."""
+
+    def test_accepts_allowed_files(self):
+        """Allowed extensions in any case, within the size limit, pass."""
+        from app.main import _validate_uploads
+
+        self.assertIsNone(_validate_uploads([_upload("a.JPG", 10), _upload("b.png", None)]))
+
+    def test_rejects_bad_extension(self):
+        """The first file with a disallowed or missing extension is reported."""
+        from app.main import _validate_uploads
+
+        error = _validate_uploads([_upload("a.jpg", 10), _upload("notes.txt", 10), _upload("noext", 10)])
+
+        self.assertIn("Invalid file type: notes.txt", error)
+
+    def test_rejects_oversized_file(self):
+        """Files over the configured limit are reported with their size."""
+        from app.config import settings
+        from app.main import _validate_uploads
+
+        too_big = (settings.max_upload_size_mb + 1) * 1024 * 1024
+        error = _validate_uploads([_upload("huge.png", too_big)])
+
+        self.assertIn("File too large: huge.png", error)
+        self.assertIn(f"Max: {settings.max_upload_size_mb}MB", error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,281 @@
+"""
+Tests for the Luminate uploader library's pure helpers.
+
+Covers progress throttling, batch concurrency sizing, size filtering of
+paths and in-memory payloads, the upload-response predicate, 2FA text
+detection, direct-upload rejection parsing and the browser pool's
+storage-state fingerprint. None of these launch a browser.
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+# The library imports requests at module level
+_HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+
+def _response(url, method="POST", status=200):
+    """Minimal stand-in for a Playwright Response."""
+    return SimpleNamespace(url=url, status=status, request=SimpleNamespace(method=method))
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestThrottleProgress(unittest.TestCase):
+    """Bursts of "uploading" ticks collapse; outcomes always pass through."""
+
+    def test_none_stays_none(self):
+        """No callback means no wrapper."""
+        from lib.luminate_uploader_lib import _throttle_progress
+
+        self.assertIsNone(_throttle_progress(None))
+
+    def test_collapses_uploading_bursts(self):
+        """Only the first "uploading" tick in an interval is forwarded."""
+        from lib.luminate_uploader_lib import _throttle_progress
+
+        calls = []
+        throttled = _throttle_progress(lambda *args: calls.append(args), min_interval=0.1)
+        with mock.patch("lib.luminate_uploader_lib.time.monotonic", return_value=100.0):
+            throttled(1, 5, "a.jpg", "uploading")
+            throttled(2, 5, "b.jpg", "uploading")
+            throttled(2, 5, "b.jpg", "success")
+            throttled(5, 5, "e.jpg", "uploading")
+
+        self.assertEqual(calls, [
+            (1, 5, "a.jpg", "uploading"),
+            (2, 5, "b.jpg", "success"),
+            (5, 5, "e.jpg", "uploading"),
+        ])
+
+    def test_forwards_after_interval(self):
+        """An "uploading" tick goes through once the interval has passed."""
+        from lib.luminate_uploader_lib import _throttle_progress
+
+        calls = []
+        throttled = _throttle_progress(lambda *args: calls.append(args), min_interval=0.1)
+        with mock.patch("lib.luminate_uploader_lib.time.monotonic", side_effect=[100.0, 100.05, 100.2]):
+            throttled(1, 5, "a.jpg", "uploading")
+            throttled(2, 5, "b.jpg", "uploading")
+            throttled(3, 5, "c.jpg", "uploading")
+
+        self.assertEqual([call[0] for call in calls], [1, 3])
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestBatchConcurrency(unittest.TestCase):
+    """Concurrency grows with batch size up to the cap."""
+
+    def test_scaling(self):
+        """Small batches use the default; large ones add a page per four files."""
+        from lib.luminate_uploader_lib import (
+            MAX_UPLOAD_CONCURRENCY, MAX_UPLOAD_WORKERS, _batch_concurrency,
+        )
+
+        self.assertEqual(_batch_concurrency(1), MAX_UPLOAD_WORKERS)
+        self.assertEqual(_batch_concurrency(8), MAX_UPLOAD_WORKERS)
+        self.assertEqual(_batch_concurrency(16), min(5, MAX_UPLOAD_CONCURRENCY))
+        self.assertEqual(_batch_concurrency(1000), MAX_UPLOAD_CONCURRENCY)
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestSizeFiltering(unittest.TestCase):
+    """Files and in-memory payloads are size-checked before a batch starts."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _file(self, name, size):
+        path = os.path.join(self._tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(b"\0" * size)
+        return path
+
+    def test_check_file_size(self):
+        """Paths are stat'ed, payloads measured, and unreadable files reported."""
+        from lib.luminate_uploader_lib import check_file_size
+
+        mb = 1024 * 1024
+        self.assertEqual(check_file_size(self._file("ok.jpg", mb), max_size_mb=2), (True, None))
+        valid, error = check_file_size({"name": "big.png", "buffer": b"\0" * (3 * mb)}, max_size_mb=2)
+        self.assertFalse(valid)
+        self.assertIn("File too large", error)
+        valid, error = check_file_size(os.path.join(self._tmp.name, "missing.jpg"))
+        self.assertFalse(valid)
+        self.assertIn("Cannot read file", error)
+
+    def test_filter_keeps_everything_when_all_fit(self):
+        """When every file fits the input comes back as a new list."""
+        from lib.luminate_uploader_lib import _filter_valid_sizes
+
+        images = [self._file("a.jpg", 10), {"name": "b.png", "buffer": b"12"}]
+        valid, failed = _filter_valid_sizes(images)
+
+        self.assertEqual(valid, images)
+        self.assertIsNot(valid, images)
+        self.assertEqual(failed, [])
+
+    def test_filter_splits_mixed_batches(self):
+        """Oversized paths and payloads fail by filename; the rest keep their order."""
+        from lib.luminate_uploader_lib import _filter_valid_sizes
+
+        mb = 1024 * 1024
+        small = self._file("small.jpg", 10)
+        large = self._file("large.jpg", 2 * mb)
+        payload = {"name": "mem.png", "buffer": b"\0" * (2 * mb)}
+        other = {"name": "ok.png", "buffer": b"1"}
+
+        valid, failed = _filter_valid_sizes([large, small, payload, other], max_size_mb=1)
+
+        self.assertEqual(valid, [small, other])
+        self.assertEqual([name for name, _ in failed], ["large.jpg", "mem.png"])
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestUploadResponsePredicate(unittest.TestCase):
+    """Only a successful POST to the upload form ends the upload wait."""
+
+    def test_matches_form_action_only(self):
+        """Beacons, GETs and error responses never match."""
+        from lib.luminate_uploader_lib import upload_response_predicate
+
+        action = "https://secure2.convio.net/dfci/admin/ImageLibrary?upload=1"
+        is_upload = upload_response_predicate(action)
+
+        self.assertTrue(is_upload(_response("https://secure2.convio.net/dfci/admin/ImageLibrary?x=2")))
+        self.assertFalse(is_upload(_response("https://www.google-analytics.com/collect")))
+        self.assertFalse(is_upload(_response(action, method="GET")))
+        self.assertFalse(is_upload(_response(action, status=500)))
+
+    def test_falls_back_to_upload_url(self):
+        """Without a resolved action, any successful POST to an upload URL matches."""
+        from lib.luminate_uploader_lib import upload_response_predicate
+
+        is_upload = upload_response_predicate("")
+
+        self.assertTrue(is_upload(_response("https://secure2.convio.net/dfci/admin/ImageUpload")))
+        self.assertFalse(is_upload(_response("https://secure2.convio.net/keepalive")))
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestPageTextPatterns(unittest.TestCase):
+    """Shared page-text regexes match what they should and nothing else."""
+
+    def test_two_factor_text(self):
+        """2FA prompts match in any case; ordinary admin pages do not."""
+        from lib.luminate_uploader_lib import TWO_FACTOR_TEXT_RE
+
+        self.assertTrue(TWO_FACTOR_TEXT_RE.search("We sent a Security Code to your phone"))
+        self.assertTrue(TWO_FACTOR_TEXT_RE.search("Enter the 6-digit code"))
+        self.assertTrue(TWO_FACTOR_TEXT_RE.search("We sent a text message to your phone"))
+        self.assertIsNone(TWO_FACTOR_TEXT_RE.search("Image Library - Upload Image"))
+
+    def test_login_two_factor_text(self):
+        """login() also counts a bare "verification" prompt as 2FA."""
+        from lib.luminate_uploader_lib import _LOGIN_TWO_FACTOR_TEXT_RE, TWO_FACTOR_TEXT_RE
+
+        self.assertTrue(_LOGIN_TWO_FACTOR_TEXT_RE.search("Verification required"))
+        self.assertTrue(_LOGIN_TWO_FACTOR_TEXT_RE.search("We sent a text message to your phone"))
+        self.assertIsNone(TWO_FACTOR_TEXT_RE.search("Verification required"))
+
+    def test_direct_upload_rejections_come_from_error_elements(self):
+        """Rejection words in scripts or help text are ignored."""
+        from lib.luminate_uploader_lib import (
+            _DIRECT_UPLOAD_ERROR_ELEMENT_RE, _DIRECT_UPLOAD_REJECTED_RE,
+        )
+
+        html = (
+            "<script>if (size > max) warn('exceed');</script>"
+            "<p class=\"help\">Duplicate names are renamed.</p>"
+            "<div class=\"ErrorMessage\">A file with that name Already Exists</div>"
+        )
+        errors = [text for _, text in _DIRECT_UPLOAD_ERROR_ELEMENT_RE.findall(html)]
+
+        self.assertEqual(errors, ["A file with that name Already Exists"])
+        self.assertEqual(_DIRECT_UPLOAD_REJECTED_RE.search(errors[0]).group(0).lower(), "already exists")
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestDirectUpload(unittest.TestCase):
+    """Only a refused session sends a direct upload back to the browser path."""
+
+    FORM = {"action": "https://secure2.convio.net/upload", "fields": [], "fileField": "file", "submit": None}
+    IMAGE = {"name": "a.png", "mimeType": "image/png", "buffer": b"1"}
+
+    def _post(self, status=200, url="https://secure2.convio.net/upload", text="", verified=False):
+        import lib.luminate_uploader_lib as lib
+
+        session = mock.Mock()
+        session.post.return_value = SimpleNamespace(status_code=status, url=url, text=text)
+        with mock.patch.object(lib, "verify_upload", return_value=verified):
+            return lib._upload_image_direct(session, self.FORM, self.IMAGE)
+
+    def test_refused_session_falls_back(self):
+        """401/403 and login redirects return None for the browser path."""
+        self.assertIsNone(self._post(status=403))
+        self.assertIsNone(self._post(url="https://secure2.convio.net/dfci/admin/AdminLogin"))
+
+    def test_accepted_post_is_never_resubmitted(self):
+        """An accepted POST is final: verified, rejected or unverified."""
+        from lib.luminate_uploader_lib import VERIFY_FAILED_MESSAGE
+
+        self.assertTrue(self._post(verified=True)[0])
+        rejected = self._post(text='<div class="error">File already exists</div>')
+        self.assertEqual(rejected[2], "Upload failed: already exists")
+        self.assertEqual(self._post()[2], VERIFY_FAILED_MESSAGE)
+        self.assertEqual(self._post(status=500)[2], "Upload failed: HTTP 500")
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestAutoLoginFallback(unittest.TestCase):
+    """Cookie batches fall back to a password login only when the session was rejected."""
+
+    def _run(self, cookie_error):
+        import lib.luminate_uploader_lib as lib
+
+        cookie_result = {'successful': [], 'failed': [("a.jpg", cookie_error)], 'urls': []}
+        login_result = {'successful': ["a.jpg"], 'failed': [], 'urls': ["u"]}
+        with mock.patch.object(lib, "upload_images_with_cookies", return_value=cookie_result), \
+                mock.patch.object(lib, "upload_images_batch", return_value=login_result) as batch:
+            result = lib.upload_images_auto(["a.jpg"], username="u", password="p", cookies=[{}])
+        return result, batch
+
+    def test_session_rejection_logs_in(self):
+        """A rejected session retries the batch with username and password."""
+        from lib.luminate_uploader_lib import SESSION_EXPIRED_MESSAGE
+
+        result, batch = self._run(SESSION_EXPIRED_MESSAGE)
+
+        batch.assert_called_once()
+        self.assertEqual(result['auth_method'], 'login')
+
+    def test_per_file_error_does_not_log_in(self):
+        """Errors that merely mention sessions or logins are reported as-is."""
+        result, batch = self._run("Upload failed: invalid file; see login page")
+
+        batch.assert_not_called()
+        self.assertEqual(result['auth_method'], 'cookies')
+
+
+@unittest.skipUnless(_HAS_REQUESTS, "requests is not installed")
+class TestBrowserPoolFingerprint(unittest.TestCase):
+    """Pooled contexts are keyed by a stable storage-state fingerprint."""
+
+    def test_fingerprint_ignores_key_order(self):
+        """Equal states hash equally; different cookies do not."""
+        from lib.luminate_uploader_lib import _BrowserPool
+
+        state = {"cookies": [{"name": "a", "value": "1"}], "origins": []}
+        reordered = {"origins": [], "cookies": [{"value": "1", "name": "a"}]}
+        other = {"cookies": [{"name": "a", "value": "2"}], "origins": []}
+
+        self.assertEqual(_BrowserPool.fingerprint(state), _BrowserPool.fingerprint(reordered))
+        self.assertNotEqual(_BrowserPool.fingerprint(state), _BrowserPool.fingerprint(other))
+
+
+if __name__ == "__main__":
+    unittest.main()